@@ -1,9 +1,17 @@
 """Peloterm - A terminal-based cycling metrics visualization tool."""
 
-import importlib.metadata
 
-try:
-    __version__ = importlib.metadata.version("peloterm")
-except importlib.metadata.PackageNotFoundError:
-    # Fallback for development when package is not installed
-    __version__ = "0.1.0-dev" 
\ No newline at end of file
+def __getattr__(name):
+    # Resolve the version on first access; importlib.metadata is slow to import
+    # and only `--version` needs it
+    if name == "__version__":
+        import importlib.metadata
+
+        try:
+            version = importlib.metadata.version("peloterm")
+        except importlib.metadata.PackageNotFoundError:
+            # Fallback for development when package is not installed
+            version = "0.1.0-dev"
+        globals()["__version__"] = version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
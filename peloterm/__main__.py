@@ -0,0 +1,21 @@
+"""Console entry point for Peloterm."""
+
+import sys
+
+
+def main():
+    """Run the CLI, answering a bare --version without building the Typer app."""
+    if sys.argv[1:] in (["-v"], ["--version"]):
+        from rich.console import Console
+        from . import __version__
+        from .logo import get_version_banner
+
+        Console().print(get_version_banner(__version__))
+        return
+
+    from .cli import app
+    app()
+
+
+if __name__ == "__main__":
+    main()
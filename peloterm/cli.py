@@ -1,41 +1,21 @@
 """Command-line interface for Peloterm."""
 
-import asyncio
 import typer
 from pathlib import Path
-from typing import Optional, Dict
-import threading
-import webbrowser
+from typing import Optional, TYPE_CHECKING
 import time
-import signal
-import traceback
 from rich.console import Console
-from rich.panel import Panel
-from rich.status import Status
-from rich.table import Table
-
-from rich import print as rprint
-from enum import Enum
-from . import __version__
-from .monitor import start_monitoring as start_hr_monitoring
-from .trainer import start_trainer_monitoring
-from .scanner import scan_sensors, discover_devices, display_devices
-from .controller import DeviceController, start_monitoring_with_config
-from .config import (
-    Config,
-    MetricConfig,
-    METRIC_DISPLAY_NAMES,
-    create_default_config_from_scan,
-    save_config,
-    load_config,
-    get_default_config_path
-)
-from .web.server import start_server, broadcast_metrics, stop_server, web_server
-from .web.mock_data import start_mock_data_stream
-from .strava_integration import StravaUploader
-from .data_recorder import RideRecorder
+from rich.style import Style
+
 from .logo import display_logo, get_version_banner
 
+# asyncio, the YAML config loader, rich's Table/Panel and the device, web server
+# and Strava modules (bleak, FastAPI, requests) are imported inside the commands
+# that need them so `peloterm --help` and `--version` start fast.
+if TYPE_CHECKING:
+    import asyncio
+    from .config import Config
+
 app = typer.Typer(
     help="Peloterm - A terminal-based cycling metrics visualization tool",
     add_completion=False,
@@ -46,22 +26,24 @@ console = Console()
 strava_app = typer.Typer(help="Strava integration commands")
 app.add_typer(strava_app, name="strava")
 
-class DeviceType(str, Enum):
-    """Available device types."""
-    HEART_RATE = "heart_rate"
-    TRAINER = "trainer"
-    SPEED_CADENCE = "speed_cadence"
+# Device table styles, parsed once rather than on every render
+_DEVICE_TABLE_HEADER_STYLE = Style.parse("bold blue")
+_DEVICE_TABLE_COLUMNS = (
+    ("Device Name", Style.parse("cyan")),
+    ("Services", Style.parse("magenta")),
+    ("Metrics", Style.parse("green")),
+)
 
-class MetricType(str, Enum):
-    """Available metric types."""
-    HEART_RATE = "heart_rate"
-    POWER = "power"
-    SPEED = "speed"
-    CADENCE = "cadence"
+# Static part of the start-up message, printed together with the header
+_LISTENING_HINT = (
+    "\nI'll listen for your configured devices. Turn them on when you're ready!\n"
+    "Press Ctrl+C to stop.\n"
+)
 
 def version_callback(value: bool):
     """Print version information with logo."""
     if value:
+        from . import __version__
         console.print(get_version_banner(__version__))
         raise typer.Exit()
 
@@ -86,28 +68,32 @@ def logo(
     """Display the Peloterm logo."""
     display_logo(console, style)
 
-def display_device_table(config: Config):
+def display_device_table(config: "Config"):
     """Display a table of configured devices and their metrics."""
-    table = Table(title="Configured Devices", show_header=True, header_style="bold blue")
-    table.add_column("Device Name", style="cyan")
-    table.add_column("Services", style="magenta")
-    table.add_column("Metrics", style="green")
+    from rich.table import Table
+
+    table = Table(title="Configured Devices", show_header=True, header_style=_DEVICE_TABLE_HEADER_STYLE)
+    for header, style in _DEVICE_TABLE_COLUMNS:
+        table.add_column(header, style=style)
 
+    # Index metrics by device once instead of scanning all metrics per row
+    metrics_by_device = config.metrics_by_device()
     for device in config.devices:
-        # Get metrics for this device
-        device_metrics = [
-            metric.display_name for metric in config.display 
-            if metric.device == device.name
-        ]
         table.add_row(
             device.name,
             ", ".join(device.services),
-            ", ".join(device_metrics)
+            ", ".join(metrics_by_device.get(device.name, ()))
         )
     
     console.print(table)
 
-
+async def _cancel_tasks(*tasks: "asyncio.Task"):
+    """Cancel tasks and wait for them to finish, ignoring their results."""
+    import asyncio
+    
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
 
 @app.command()
 def start(
@@ -126,38 +112,65 @@ def start(
     no_recording: bool = typer.Option(False, "--no-recording", help="Disable ride recording (recording enabled by default)")
 ):
     """Start Peloterm with the specified configuration."""
-    
-    # Load configuration
-    if config_path is None:
-        config_path = get_default_config_path()
-    config = load_config(config_path)
+    import asyncio
+    import signal
+    import webbrowser
+    from rich.table import Table
+    from .config import Config, load_config, get_default_config_path
+    from .controller import DeviceController, install_uvloop
+    from .web.server import serve_server, queue_metrics, stop_server
+    
+    install_uvloop()
+    
+    # Load configuration. The web UI in mock mode never reads devices or display
+    # settings, so skip parsing the config file there; the terminal display
+    # still builds its monitors from the configured metrics.
+    if mock and web:
+        config = Config()
+    else:
+        if config_path is None:
+            config_path = get_default_config_path()
+        config = load_config(config_path)
     config.mock_mode = mock
     
     # Recording is enabled by default unless explicitly disabled
     enable_recording = not no_recording
     
     # Create an event to signal shutdown
-    shutdown_event = threading.Event()
+    shutdown_event = asyncio.Event()
     controller = None
     
-    def signal_handler(signum, frame):
+    def request_shutdown():
+        """Handle SIGINT/SIGTERM on the event loop."""
+        # uvicorn re-raises the signals it captured while serving, so this
+        # can run more than once
+        if shutdown_event.is_set():
+            return
         console.print("\n[yellow]Gracefully shutting down Peloterm...[/yellow]")
         shutdown_event.set()
+        # Stop the terminal display loop if it's running
+        if controller:
+            controller.stop()
         # Also stop the web server if it's running (needed for mock mode)
-        if web_server:
-            web_server.stop()
+        stop_server()
     
-    # Set up signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    def install_signal_handlers():
+        """Route shutdown signals through the running event loop."""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, request_shutdown)
+            except NotImplementedError:
+                # Windows event loops don't support add_signal_handler
+                signal.signal(sig, lambda signum, frame: loop.call_soon_threadsafe(request_shutdown))
     
-    # Show listening mode interface
+    # Show listening mode interface in a single render
     display_logo(console, "compact")
-    console.print("[bold blue]🎧 Starting Peloterm[/bold blue]")
-    if enable_recording:
-        console.print("[green]📹 Ride recording enabled[/green]")
-    console.print("\nI'll listen for your configured devices. Turn them on when you're ready!")
-    console.print("Press Ctrl+C to stop.\n")
+    console.print(
+        "[bold blue]🎧 Starting Peloterm[/bold blue]\n"
+        + ("[green]📹 Ride recording enabled[/green]\n" if enable_recording else "")
+        + _LISTENING_HINT
+    )
     
     # Display expected devices
     if config.devices and not config.mock_mode:
@@ -166,130 +179,123 @@ def start(
         table.add_column("Type", style="magenta")
         
         for device in config.devices:
-            device_type = "Unknown"
-            if "Heart Rate" in device.services:
-                device_type = "Heart Rate Monitor"
-            elif "Power" in device.services:
-                device_type = "Trainer/Power Meter"
-            elif any(s in ["Speed/Cadence", "Speed", "Cadence"] for s in device.services):
-                device_type = "Speed/Cadence Sensor"
-            
-            table.add_row(device.name, device_type)
+            table.add_row(device.name, device.device_type)
         
         console.print(table)
         console.print()
     
     if web:
-        # Start web server in a separate thread
-        web_thread = None
-        try:
-            def run_web_server():
-                start_server(port=port, ride_duration_minutes=duration)
+        url = f"http://localhost:{port}"
+        
+        # Initialize controller earlier, it handles mock mode internally
+        controller = DeviceController(config=config, show_display=False, enable_recording=enable_recording)
+        controller.debug_mode = debug # Pass debug setting to controller
+
+        # Set up web UI callbacks in the controller
+        # The controller will now handle broadcasting for both mock and real devices.
+        # Samples are queued and applied in batches on the server's event loop.
+        controller.set_web_ui_callbacks(queue_metrics)
+
+        if config.mock_mode: # Changed from 'if mock:'
+            console.print("[yellow]Mock mode: Peloterm will use internal mock data.[/yellow]")
+            # For mock mode, connection is simulated, and data flow starts via callbacks
+            # The DeviceController's connect_configured_devices will handle MockDevice connection
+
+        # Unified device monitoring logic for web mode
+        async def monitor_web_devices():
+            nonlocal controller # Ensure controller is from the outer scope
+            install_signal_handlers()
             
-            web_thread = threading.Thread(target=run_web_server, daemon=True)
-            web_thread.start()
+            # Serve the web UI on this loop so device callbacks and the
+            # metric update loop share one thread
+            server_ready = asyncio.Event()
+            server_task = asyncio.create_task(
+                serve_server(port=port, ride_duration_minutes=duration, ready_event=server_ready)
+            )
             
-            # Give the server a moment to start
-            time.sleep(1)
+            # Wait for the server to accept connections before opening the browser,
+            # or stop waiting if it fails to start (e.g. the port is in use)
+            ready_task = asyncio.create_task(server_ready.wait())
+            await asyncio.wait({ready_task, server_task}, timeout=5, return_when=asyncio.FIRST_COMPLETED)
+            await _cancel_tasks(ready_task)
+            server_failed = server_task.done() and server_task.exception() is not None
+            if server_failed:
+                # Keep monitoring devices without the web UI
+                console.print(
+                    f"[red]❌ {server_task.exception()}. Is port {port} already in use?[/red]"
+                )
+                console.print(
+                    "[yellow]⚠️  Continuing without the web UI. Press Ctrl+C to stop.[/yellow]"
+                )
+            else:
+                console.print(f"[green]Web UI available at: {url}[/green]")
+                console.print(f"[blue]Target ride duration: {duration} minutes[/blue]")
+                # Launching the browser can block for a while, so keep it off the event loop
+                asyncio.get_running_loop().run_in_executor(None, webbrowser.open, url)
             
-            # Open web browser
-            url = f"http://localhost:{port}"
-            console.print(f"[green]Web UI available at: {url}[/green]")
-            console.print(f"[blue]Target ride duration: {duration} minutes[/blue]")
-            webbrowser.open(url)
+            # Start device connection in the background without blocking
+            console.print("[blue]🔍 Starting device connection in background...[/blue]")
             
-            # Initialize controller earlier, it handles mock mode internally
-            controller = DeviceController(config=config, show_display=False, enable_recording=enable_recording)
-            controller.debug_mode = debug # Pass debug setting to controller
-
-            # Set up web UI callbacks in the controller
-            # The controller will now handle broadcasting for both mock and real devices
-            controller.set_web_ui_callbacks(broadcast_metrics)
-
-            if config.mock_mode: # Changed from 'if mock:'
-                console.print("[yellow]Mock mode: Peloterm will use internal mock data.[/yellow]")
-                # For mock mode, connection is simulated, and data flow starts via callbacks
-                # The DeviceController's connect_configured_devices will handle MockDevice connection
-
-            # Unified device monitoring logic for web mode
-            async def monitor_web_devices():
-                nonlocal controller # Ensure controller is from the outer scope
-                
-                # Start device connection in the background without blocking
-                console.print("[blue]🔍 Starting device connection in background...[/blue]")
+            # Create a task for device connection that runs in parallel
+            async def connect_devices_background():
+                connected = await listen_for_devices_connection(controller, config, timeout, debug, shutdown_event)
                 
-                # Create a task for device connection that runs in parallel
-                async def connect_devices_background():
-                    connected = await listen_for_devices_connection(controller, config, timeout, debug, shutdown_event)
-                    
-                    if connected:
-                        console.print("[green]✅ Device connection complete![/green]")
+                if connected:
+                    console.print("[green]✅ Device connection complete![/green]")
+                    if not server_failed:
                         console.print("[blue]🌐 Devices now streaming to web UI...[/blue]")
-                        
-                        if enable_recording and controller.ride_recorder and not controller.ride_recorder.is_recording:
-                            controller.start_recording()
-                            console.print("[green]🎬 Recording started![/green]")
-                    else:
-                        console.print("[yellow]⚠️  No devices connected, but web UI remains available.[/yellow]")
-                
-                # Start device connection as a background task
-                connection_task = asyncio.create_task(connect_devices_background())
-                
-                try:
-                    # Main monitoring loop - runs immediately while devices connect in background
-                    console.print("[blue]🌐 Web UI is ready! Devices will appear as they connect...[/blue]")
-                    
-                    while not shutdown_event.is_set():
-                        await asyncio.sleep(refresh_rate) # Main loop to keep things running
-                        if debug:
-                            console.print("[dim]Web monitoring active...[/dim]")
-                            
-                finally:
-                    # Clean up connection task if still running
-                    if not connection_task.done():
-                        connection_task.cancel()
-                        try:
-                            await connection_task
-                        except asyncio.CancelledError:
-                            pass
                     
-                    if controller.ride_recorder and controller.ride_recorder.is_recording:
-                         console.print("[dim]Stopping recording due to shutdown...[/dim]")
-                    # Disconnection should happen on the same loop if parts of it are async
-                    # or be robust to being called from a different context.
-                    if controller and controller.connected_devices: # Check if there are devices to disconnect
-                        await controller.disconnect_devices() 
+                    if enable_recording and controller.ride_recorder and not controller.ride_recorder.is_recording:
+                        controller.start_recording()
+                        console.print("[green]🎬 Recording started![/green]")
+                else:
+                    console.print("[yellow]⚠️  No devices connected, but web UI remains available.[/yellow]")
+            
+            # Start device connection as a background task
+            connection_task = asyncio.create_task(connect_devices_background())
+            shutdown_task = asyncio.create_task(shutdown_event.wait())
             
             try:
-                # Use asyncio.run() for the main async logic for this part of the application.
-                # This manages the event loop creation and closing.
-                asyncio.run(monitor_web_devices())
-            except KeyboardInterrupt:
-                console.print("\n[yellow]Web monitoring interrupted by user (KeyboardInterrupt).[/yellow]")
-                shutdown_event.set() # Ensure shutdown is signaled
-            except SystemExit:
-                console.print("\n[yellow]SystemExit caught, initiating shutdown.[/yellow]")
-                shutdown_event.set() # Ensure shutdown is signaled
-            except Exception as e:
-                if debug:
-                    console.print(f"[red]Error during web monitoring: {e}[/red]")
-                shutdown_event.set() # Ensure shutdown on other errors too
+                # Main monitoring loop - runs immediately while devices connect in background
+                if not server_failed:
+                    console.print(
+                        "[blue]🌐 Web UI is ready! Devices will appear as they connect...[/blue]"
+                    )
+                
+                # Sleep until shutdown is signaled; a running server task also
+                # ends if uvicorn handles the signal itself
+                wait_for = {shutdown_task} if server_failed else {server_task, shutdown_task}
+                await asyncio.wait(wait_for, return_when=asyncio.FIRST_COMPLETED)
+                        
             finally:
-                # This finally block is for the try/except around asyncio.run()
-                console.print("[dim]Ensuring shutdown signal is set before main web finally block.[/dim]")
-                shutdown_event.set() # Ensure it's set so main finally block acts correctly
-                pass
-
-        finally:
-            # This is the outermost finally for the `if web:` block
-            console.print(f"[dim]Outermost finally for 'if web:' reached. Shutdown event set: {shutdown_event.is_set()}[/dim]")
-            
-            # Stop the web server
-            stop_server()
-            if web_thread:
-                web_thread.join(timeout=1.0)
-            
-            console.print("[green]Shutdown complete[/green]")
+                # Stop the helper tasks started above before tearing down devices
+                await _cancel_tasks(connection_task, shutdown_task)
+                
+                if controller.ride_recorder and controller.ride_recorder.is_recording:
+                     console.print("[dim]Stopping recording due to shutdown...[/dim]")
+                if controller and controller.connected_devices: # Check if there are devices to disconnect
+                    await controller.disconnect_devices() 
+                
+                # Stop the web server and let uvicorn finish its shutdown
+                stop_server()
+                try:
+                    await server_task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        
+        try:
+            # asyncio.run() owns the loop; monitor_web_devices() tears down
+            # devices and the server in its own finally block.
+            asyncio.run(monitor_web_devices())
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Web monitoring interrupted by user (KeyboardInterrupt).[/yellow]")
+        except SystemExit:
+            console.print("\n[yellow]SystemExit caught, initiating shutdown.[/yellow]")
+        except Exception as e:
+            if debug:
+                console.print(f"[red]Error during web monitoring: {e}[/red]")
+
+        console.print("[green]Shutdown complete[/green]")
     else:
         # Terminal mode
         controller = DeviceController(config, show_display=True, enable_recording=enable_recording)
@@ -301,75 +307,47 @@ def start(
         else:
             console.print("[yellow]Mock mode: Peloterm will use internal mock data for terminal.[/yellow]")
         
-        # Event loop for terminal mode
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        async def monitor_terminal_devices():
+            install_signal_handlers()
+            try:
+                # `connect_configured_devices` in controller handles mock device connection internally
+                connected = await listen_for_devices_connection(controller, config, timeout, debug, shutdown_event)
+                
+                if connected and not shutdown_event.is_set():
+                    console.print("\n[green]✅ Device connection complete![/green]")
+                    console.print("[green]🚴 Starting terminal monitoring...[/green]")
+                    
+                    if enable_recording and not controller.ride_recorder.is_recording:
+                        controller.start_recording()
+                        console.print("[green]🎬 Recording started![/green]")
+                    
+                    # The controller.run method handles its own display loop for terminal
+                    await controller.run(refresh_rate=refresh_rate)
+                else:
+                    console.print("\n[yellow]❌ Device listening cancelled or no devices connected for terminal.[/yellow]")
+            finally:
+                # Ensure devices are disconnected; asyncio.run cancels any leftover tasks
+                if not config.mock_mode and controller.connected_devices:
+                    if debug:
+                        console.print("[yellow]Disconnecting devices...[/yellow]")
+                    await controller.disconnect_devices()
+                    # Let bleak's disconnect callbacks run before the loop closes
+                    await asyncio.sleep(0)
         
         try:
-            # `connect_configured_devices` in controller handles mock device connection internally
-            connected = loop.run_until_complete(
-                listen_for_devices_connection(controller, config, timeout, debug, shutdown_event)
-            )
-            
-            if connected and not shutdown_event.is_set():
-                console.print("\n[green]✅ Device connection complete![/green]")
-                console.print("[green]🚴 Starting terminal monitoring...[/green]")
-                
-                if enable_recording and not controller.ride_recorder.is_recording:
-                    controller.start_recording()
-                    console.print("[green]🎬 Recording started![/green]")
-                
-                # The controller.run method handles its own display loop for terminal
-                loop.run_until_complete(controller.run(refresh_rate=refresh_rate))
-            else:
-                console.print("\n[yellow]❌ Device listening cancelled or no devices connected for terminal.[/yellow]")
+            asyncio.run(monitor_terminal_devices())
         except KeyboardInterrupt:
             console.print("\n[yellow]Monitoring stopped by user[/yellow]")
         except Exception as e:
             console.print(f"\n[red]Error: {e}[/red]")
             if debug:
                 raise
-        finally:
-            if not config.mock_mode:
-                try:
-                    # Ensure devices are disconnected first
-                    if controller.connected_devices:
-                        if debug:
-                            console.print("[yellow]Disconnecting devices...[/yellow]")
-                        loop.run_until_complete(controller.disconnect_devices())
-                        # Give BLE stack more time to clean up
-                        time.sleep(1.0)
-                    
-                    # Clean up the loop
-                    pending = asyncio.all_tasks(loop)
-                    for task in pending:
-                        task.cancel()
-                    
-                    # Wait for all tasks to complete with timeout
-                    if pending:
-                        try:
-                            loop.run_until_complete(asyncio.wait_for(
-                                asyncio.gather(*pending, return_exceptions=True),
-                                timeout=2.0
-                            ))
-                        except asyncio.TimeoutError:
-                            if debug:
-                                console.print("[dim]Some tasks didn't complete in time, forcing cleanup[/dim]")
-                    
-                    loop.close()
-                except Exception as e:
-                    if debug:
-                        console.print(f"[red]Error during cleanup: {e}[/red]")
-                    # Force close the loop even if there are errors
-                    try:
-                        if not loop.is_closed():
-                            loop.close()
-                    except:
-                        pass
 
 
 async def listen_for_devices_connection(controller, config, timeout, debug, shutdown_event):
     """Handle listening for device connections with enhanced user guidance."""
+    import asyncio
+    from rich.table import Table
     
     if config.mock_mode:
         # In mock mode, we only care about connecting the single MockDevice.
@@ -410,42 +388,132 @@ async def listen_for_devices_connection(controller, config, timeout, debug, shut
     console.print(f"   • If a device doesn't connect, try turning it off/on")
     console.print(f"   • Connection timeout: {timeout} seconds\n")
 
-    start_time = asyncio.get_event_loop().time()
+    from bleak import BleakScanner
+    from bleak.exc import BleakError
+    from .device_manager import is_device_name_match
+    
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
     last_progress_update = 0
-    connection_attempts = {}
+    
+    # Keep one passive scan running and only attempt a connection once a missing
+    # device advertises, instead of re-scanning for every device on a fixed tick.
+    # Devices match by address, or by the same flexible name matching used for
+    # discovery, since advertised names can differ in case or suffix
+    connected_names = {device.device_name for device in controller.connected_devices}
+    pending = {
+        device_config.name: (device_config, device_config.address.lower(), device_config.name.lower())
+        for device_config in config.devices
+        if device_config.name not in connected_names
+    }
+    seen_devices = {}
+    device_seen = asyncio.Event()
+    
+    def find_pending_config(ble_device):
+        address = ble_device.address.lower()
+        for device_config, address_lower, _ in pending.values():
+            if address_lower == address:
+                return device_config
+        if ble_device.name:
+            name_lower = ble_device.name.lower()
+            for device_config, _, target_lower in pending.values():
+                if is_device_name_match(name_lower, target_lower):
+                    return device_config
+        return None
+    
+    def on_advertisement(ble_device, advertisement_data):
+        device_config = find_pending_config(ble_device)
+        if device_config:
+            seen_devices[device_config.name] = device_config
+            device_seen.set()
+    
+    async def connect(device_config):
+        try:
+            return device_config, await controller.connect_device(
+                device_config, debug=debug, suppress_failures_during_listening=True
+            )
+        except Exception as e:
+            if debug:
+                console.print(f"[red]Error connecting device: {e}[/red]")
+            return device_config, False
+    
+    scanner = BleakScanner(detection_callback=on_advertisement)
+    scanning = False
+    scan_failed = False
+    
+    async def stop_scanning():
+        nonlocal scanning
+        scanning = False
+        try:
+            await scanner.stop()
+        except (BleakError, OSError) as e:
+            if debug:
+                console.print(f"[red]Error stopping scanner: {e}[/red]")
     
     console.print(f"[yellow]🔍 Listening for devices... (0/{total_devices} connected)[/yellow]")
     
-    while connected_count < total_devices and not shutdown_event.is_set():
-        current_time = asyncio.get_event_loop().time()
-        elapsed = current_time - start_time
-        
-        if elapsed > timeout:
-            console.print(f"\n[yellow]⏰ Connection timeout reached ({timeout}s).[/yellow]")
-            break
-        
-        # Show progress every 10 seconds
-        if elapsed - last_progress_update >= 10:
-            remaining_time = max(0, timeout - elapsed)
-            console.print(f"[dim]⏳ Still searching... ({connected_count}/{total_devices} connected, {remaining_time:.0f}s remaining)[/dim]")
-            last_progress_update = elapsed
-        
-        # Try to connect to any missing devices (suppress failure messages during listening)
-        old_connected_count = connected_count
-        if await controller.connect_configured_devices(debug=debug, suppress_failures_during_listening=True):
-            connected_count = len(controller.connected_devices)
-            if connected_count > old_connected_count:
-                newly_connected = connected_count - old_connected_count
-                if connected_count >= total_devices:
-                    console.print(f"\n[green]🎉 All {total_devices} devices connected successfully![/green]")
+    try:
+        while connected_count < total_devices and not shutdown_event.is_set():
+            elapsed = loop.time() - start_time
+            
+            if elapsed > timeout:
+                console.print(f"\n[yellow]⏰ Connection timeout reached ({timeout}s).[/yellow]")
+                break
+            
+            # Show progress every 10 seconds
+            if elapsed - last_progress_update >= 10:
+                remaining_time = max(0, timeout - elapsed)
+                console.print(f"[dim]⏳ Still searching... ({connected_count}/{total_devices} connected, {remaining_time:.0f}s remaining)[/dim]")
+                last_progress_update = elapsed
+            
+            if not scanning:
+                try:
+                    await scanner.start()
+                except (BleakError, OSError) as e:
+                    # e.g. no Bluetooth adapter, or it is off
+                    console.print(f"\n[red]❌ Could not start Bluetooth scanning: {e}[/red]")
+                    scan_failed = True
                     break
-                else:
-                    console.print(f"\n[cyan]📱 Progress: {connected_count}/{total_devices} devices connected (+{newly_connected})[/cyan]")
+                scanning = True
+            
+            # Sleep until a configured device advertises, shutdown is requested,
+            # or it's time for the next progress update or the timeout
+            wait_time = max(0, min(timeout - elapsed, last_progress_update + 10 - elapsed))
+            seen_task = asyncio.create_task(device_seen.wait())
+            shutdown_task = asyncio.create_task(shutdown_event.wait())
+            await asyncio.wait({seen_task, shutdown_task}, timeout=wait_time, return_when=asyncio.FIRST_COMPLETED)
+            await _cancel_tasks(seen_task, shutdown_task)
+            device_seen.clear()
+            # Devices that failed to connect stay in seen_devices, so they are
+            # retried on the next wakeup even if they don't advertise again
+            if not seen_devices or shutdown_event.is_set():
+                continue
+            
+            # Pause scanning while connecting; some adapters can't do both at once
+            await stop_scanning()
+            
+            # Connect to every device seen so far at once (suppress failure messages during
+            # listening), reporting each one as soon as its own connection finishes
+            for connection in asyncio.as_completed([connect(c) for c in seen_devices.values()]):
+                device_config, connected = await connection
+                if connected:
+                    seen_devices.pop(device_config.name, None)
+                    pending.pop(device_config.name, None)
+                
+                old_connected_count = connected_count
+                connected_count = len(controller.connected_devices)
+                if connected_count > old_connected_count and connected_count < total_devices:
+                    elapsed = loop.time() - start_time
+                    console.print(f"\n[cyan]📱 Progress: {connected_count}/{total_devices} devices connected (+{connected_count - old_connected_count})[/cyan]")
                     remaining_time = max(0, timeout - elapsed)
                     console.print(f"[yellow]🔍 Still searching for {total_devices - connected_count} more device(s)... ({remaining_time:.0f}s remaining)[/yellow]")
-        
-        # Wait a bit before trying again (reduced for more responsive feedback)
-        await asyncio.sleep(1.5)
+            
+            if connected_count >= total_devices:
+                console.print(f"\n[green]🎉 All {total_devices} devices connected successfully![/green]")
+                break
+    finally:
+        if scanning:
+            await stop_scanning()
     
     # Final status report
     if connected_count == total_devices:
@@ -467,7 +535,10 @@ async def listen_for_devices_connection(controller, config, timeout, debug, shut
             console.print(f"   • Turn them on and they should auto-reconnect")
             console.print(f"   • Or restart peloterm with: peloterm start --timeout {timeout + 30}")
     else:
-        console.print(f"[red]❌ No devices connected after {timeout} seconds.[/red]")
+        if scan_failed:
+            console.print(f"[red]❌ No devices connected.[/red]")
+        else:
+            console.print(f"[red]❌ No devices connected after {timeout} seconds.[/red]")
         console.print(f"[blue]💡 Troubleshooting suggestions:[/blue]")
         console.print(f"   1. Check that devices are turned on and in pairing mode")
         console.print(f"   2. Try moving closer to your computer (within 3 feet)")
@@ -488,6 +559,11 @@ def scan(
     debug: bool = typer.Option(False, "--debug", "-d", help="Enable debug mode")
 ):
     """Scan for BLE devices and create a configuration file."""
+    import asyncio
+    from rich.panel import Panel
+    from .config import create_default_config_from_scan, save_config, get_default_config_path
+    from .scanner import discover_devices, display_devices
+    
     try:
         # First display the scan results
         console.print(Panel.fit("Scanning for Devices", style="bold blue"))
@@ -515,6 +591,7 @@ def scan(
 @strava_app.command("setup")
 def strava_setup():
     """Set up Strava integration by configuring API credentials."""
+    from .strava_integration import StravaUploader
     uploader = StravaUploader()
     
     if uploader.setup():
@@ -527,6 +604,7 @@ def strava_setup():
 @strava_app.command("test")
 def strava_test():
     """Test the Strava API connection."""
+    from .strava_integration import StravaUploader
     uploader = StravaUploader()
     
     if uploader.test_connection():
@@ -544,6 +622,7 @@ def strava_upload(
     activity_type: str = typer.Option("Ride", "--type", "-t", help="Activity type (default: Ride)")
 ):
     """Upload a FIT file to Strava."""
+    from .strava_integration import StravaUploader
     uploader = StravaUploader()
     
     # If no file specified, look for recent rides
@@ -583,6 +662,8 @@ def strava_upload(
 @strava_app.command("list")
 def list_rides():
     """List recorded rides available for upload."""
+    from rich.table import Table
+
     rides_dir = Path.home() / ".peloterm" / "rides"
     
     if not rides_dir.exists():
@@ -631,6 +712,8 @@ def devices(
     status: bool = typer.Option(False, "--status", help="Show current device connection status")
 ):
     """Manage and test device connections interactively."""
+    import asyncio
+    from .config import load_config, get_default_config_path
     
     # Load configuration
     if config_path is None:
@@ -707,6 +790,7 @@ def devices(
             choice = input("\nEnter your choice (1-4): ").strip()
             
             if choice == "1":
+                from .scanner import scan_sensors
                 console.print(f"[blue]Scanning for devices (timeout: {timeout}s)...[/blue]")
                 scan_sensors(timeout)
                 break
@@ -1,11 +1,19 @@
 """Configuration management for peloterm."""
 
 import os
+import shutil
+import sys
+import tempfile
 import yaml
 from typing import List, Dict, Optional, Union
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 from pathlib import Path
 
+# Use the libyaml-backed loader and dumper when PyYAML was built with them; they
+# run ~10x faster. Files are opened in binary mode so libyaml handles UTF-8 itself
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 # Standard metric names and their display versions
 METRIC_DISPLAY_NAMES = {
     'power': 'Power ⚡',
@@ -16,9 +24,18 @@ METRIC_DISPLAY_NAMES = {
 
 # Standard service to metric name mapping
 SERVICE_TO_METRIC = {
-    'Heart Rate': ['heart_rate'],
-    'Power': ['power', 'speed'],  # Trainer provides power and speed by default
-    'Speed/Cadence': ['speed', 'cadence']
+    'Heart Rate': ('heart_rate',),
+    'Power': ('power', 'speed'),  # Trainer provides power and speed by default
+    'Speed/Cadence': ('speed', 'cadence')
+}
+
+# Standard service to device type mapping, in priority order
+SERVICE_TO_DEVICE_TYPE = {
+    'Heart Rate': 'Heart Rate Monitor',
+    'Power': 'Trainer/Power Meter',
+    'Speed/Cadence': 'Speed/Cadence Sensor',
+    'Speed': 'Speed/Cadence Sensor',
+    'Cadence': 'Speed/Cadence Sensor',
 }
 
 # Standard colors for different metric types
@@ -37,14 +54,27 @@ DEFAULT_UNITS = {
     'cadence': 'RPM'
 }
 
-@dataclass
+@dataclass(slots=True)
 class DeviceConfig:
     """Configuration for a single device."""
     name: str
     address: str
     services: List[str]
 
-@dataclass
+    @property
+    def device_type(self) -> str:
+        """The device type implied by the first matching service, or 'Unknown'.
+        
+        Derived on access so it follows changes to services; it is only read
+        when devices are listed or connected, never per metric.
+        """
+        return next(
+            (device_type for service, device_type in SERVICE_TO_DEVICE_TYPE.items()
+             if service in self.services),
+            'Unknown'
+        )
+
+@dataclass(slots=True)
 class MetricConfig:
     """Configuration for a single metric display."""
     metric: str  # Internal metric name
@@ -52,7 +82,12 @@ class MetricConfig:
     device: Optional[str] = None  # Device name to get metric from
     color: Optional[str] = None  # Color for the metric display
 
-@dataclass
+    def __post_init__(self):
+        """Intern the metric name so lookups with device-supplied names can match by identity."""
+        if isinstance(self.metric, str):
+            self.metric = sys.intern(self.metric)
+
+@dataclass(slots=True)
 class Config:
     """Configuration for peloterm."""
     devices: List[DeviceConfig] = field(default_factory=list)
@@ -70,8 +105,8 @@ class Config:
             if not os.path.exists(source):
                 return cls()
             
-            with open(source, 'r') as f:
-                data = yaml.safe_load(f)
+            with open(source, 'rb') as f:
+                data = yaml.load(f, Loader=_YAML_LOADER)
         else:
             data = source
         
@@ -101,6 +136,13 @@ class Config:
             mock_mode=data.get('mock_mode', False)
         )
     
+    def metrics_by_device(self) -> Dict[Optional[str], List[str]]:
+        """Map each device name to the display names of the metrics it provides."""
+        index: Dict[Optional[str], List[str]] = {}
+        for metric in self.display:
+            index.setdefault(metric.device, []).append(metric.display_name)
+        return index
+    
     def save(self, target: Union[str, Path, Dict]):
         """Save configuration to a file path or dictionary.
         
@@ -130,8 +172,33 @@ class Config:
         
         if isinstance(target, (str, Path)):
             os.makedirs(os.path.dirname(str(target)), exist_ok=True)
-            with open(target, 'w') as f:
-                yaml.safe_dump(data, f, default_flow_style=False)
+            # Serialize in memory, then swap the file in atomically so an
+            # interrupted save never leaves a truncated config behind
+            content = yaml.dump(data, Dumper=_YAML_DUMPER, default_flow_style=False, encoding='utf-8')
+            target = os.path.abspath(target)
+            tmp = tempfile.NamedTemporaryFile(
+                dir=os.path.dirname(target),
+                prefix=f".{os.path.basename(target)}.",
+                suffix='.tmp',
+                delete=False,
+            )
+            try:
+                with tmp:
+                    tmp.write(content)
+                    tmp.flush()
+                    os.fsync(tmp.fileno())
+                # Keep the permissions of the config being replaced, or give a
+                # new config the umask default instead of the temp file's 0600
+                if os.path.exists(target):
+                    shutil.copymode(target, tmp.name)
+                else:
+                    umask = os.umask(0)
+                    os.umask(umask)
+                    os.chmod(tmp.name, 0o666 & ~umask)
+                os.replace(tmp.name, target)
+            except BaseException:
+                os.unlink(tmp.name)
+                raise
         else:
             target.update(data)
 
@@ -147,10 +214,11 @@ def load_config(config_path: Optional[Path] = None) -> Config:
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
-    with open(config_path, 'r') as f:
-        data = yaml.safe_load(f)
+    with open(config_path, 'rb') as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
     
-    return Config.load(str(config_path))
+    # Reuse the parsed data rather than reading the file a second time
+    return Config.load(data or {})
 
 def save_config(config: Config, config_path: Optional[Path] = None) -> None:
     """Save configuration to a YAML file."""
@@ -182,7 +250,7 @@ def create_default_config_from_scan(devices: List[Dict]) -> Config:
         # Create metric configs for each service
         for service in device['services']:
             # Get the list of metrics this service can provide
-            service_metrics = SERVICE_TO_METRIC.get(service, [service.lower()])
+            service_metrics = SERVICE_TO_METRIC.get(service, (service.lower(),))
             
             # Add each metric this service provides (if not already added)
             for metric_name in service_metrics:
@@ -1,26 +1,31 @@
 """Controller for managing multiple devices and their displays."""
 
 import asyncio
-from datetime import datetime
 from rich.console import Console
 from typing import List, Optional, Dict, Any, Callable
-from .display import MetricMonitor, MultiMetricDisplay
 from .devices.heart_rate import HeartRateDevice
 from .devices.trainer import TrainerDevice
 from .devices.speed_cadence import SpeedCadenceDevice
-from .devices.mock import MockDevice
 from .scanner import discover_devices
-from .config import Config, METRIC_DISPLAY_NAMES, DEFAULT_UNITS
-from rich.panel import Panel
-from rich.status import Status
+from .config import Config, DeviceConfig, DEFAULT_UNITS
 from .devices.base import Device
 from .data_recorder import RideRecorder
 
 console = Console()
 
+# Upper bound on how long shutdown waits for devices to disconnect
+DISCONNECT_TIMEOUT = 3.0
+
 class DeviceController:
     """Controller for managing multiple devices and their displays."""
     
+    __slots__ = (
+        "config", "heart_rate_device", "trainer_device", "speed_cadence_device",
+        "mock_device", "multi_display", "metric_monitors", "connected_devices",
+        "running", "_stop_event", "debug_mode", "show_display", "enable_recording",
+        "ride_recorder", "web_ui_active", "_web_broadcast_callback", "_device_metrics",
+    )
+    
     def __init__(self, config: Config, show_display: bool = True, enable_recording: bool = False):
         """Initialize the device controller.
         
@@ -37,8 +42,8 @@ class DeviceController:
         self.multi_display = None
         self.metric_monitors = {}  # Dictionary of metric name to monitor
         self.connected_devices = []
-        self.available_metrics = []
         self.running = False
+        self._stop_event = asyncio.Event()
         self.debug_mode = False
         self.show_display = show_display
         self.enable_recording = enable_recording
@@ -48,13 +53,22 @@ class DeviceController:
         self.web_ui_active = False
         self._web_broadcast_callback: Optional[Callable] = None
         
-        # Create metric monitors from configuration
+        # Index the internal metric names each device provides (deduplicated,
+        # in display order)
+        self._device_metrics: Dict[Optional[str], Dict[str, None]] = {}
         for metric_config in config.display:
-            self.metric_monitors[metric_config.metric] = MetricMonitor(
-                name=metric_config.display_name,
-                color=metric_config.color,
-                unit=DEFAULT_UNITS.get(metric_config.metric, '')
-            )
+            self._device_metrics.setdefault(metric_config.device, {})[metric_config.metric] = None
+        
+        # Create metric monitors for the terminal display; the display module
+        # is only imported when it will be shown
+        if show_display:
+            from .display import MetricMonitor
+            for metric_config in config.display:
+                self.metric_monitors[metric_config.metric] = MetricMonitor(
+                    name=metric_config.display_name,
+                    color=metric_config.color,
+                    unit=DEFAULT_UNITS.get(metric_config.metric, '')
+                )
     
     def set_web_ui_callbacks(self, broadcast_callback: Callable):
         """Set the callback for broadcasting metrics to the web UI."""
@@ -76,14 +90,13 @@ class DeviceController:
         if self.ride_recorder and self.ride_recorder.is_recording:
             self.ride_recorder.add_data_point(timestamp, {metric_name: value})
         
-        # Update the monitor if it exists for this metric
-        if metric_name in self.metric_monitors:
-            monitor = self.metric_monitors[metric_name]
-            monitor.update_value(value)
-            
-            # Update display if running
-            if self.show_display and self.multi_display and self.multi_display.live:
-                self.multi_display.live.update(self.multi_display.update_display())
+        # Update the terminal monitor for this metric; the live display picks
+        # up the new value on its next refresh. Nothing reads the monitors
+        # when the terminal display is off (web mode).
+        if self.show_display:
+            monitor = self.metric_monitors.get(metric_name)
+            if monitor:
+                monitor.update_value(value)
         
         # Broadcast to web UI if active
         if self.web_ui_active and self._web_broadcast_callback:
@@ -119,6 +132,8 @@ class DeviceController:
             console.log("[dim][Controller] connect_configured_devices: In mock mode.[/dim]") # Debug print
             # Ensure data_callback is set for the mock device instance
             if not self.mock_device:
+                # Only mock mode needs the simulator
+                from .devices.mock import MockDevice
                 self.mock_device = MockDevice(data_callback=self.handle_metric_data)
                 console.log("[dim][Controller] Instantiated MockDevice.[/dim]") # Debug print
             else:
@@ -137,56 +152,30 @@ class DeviceController:
                 console.log("[red][Controller] ✗ Failed to connect to mock device[/red]")
                 return False
         
-        # Prepare connection tasks for concurrent execution (only if not in mock_mode)
-        connection_tasks = []
-        
-        for device_config in self.config.devices:
-            # Create connection tasks based on service type, only if not already connected
-            if "Heart Rate" in device_config.services:
-                if not self.heart_rate_device or not (self.heart_rate_device.client and self.heart_rate_device.client.is_connected):
-                    task = self._create_heart_rate_connection_task(device_config, debug, suppress_failures_during_listening)
-                    connection_tasks.append(("heart_rate", task))
-                elif self.heart_rate_device in self.connected_devices:
-                    connected = True  # Already connected
-            
-            elif "Power" in device_config.services:
-                if not self.trainer_device or not (self.trainer_device.client and self.trainer_device.client.is_connected):
-                    task = self._create_trainer_connection_task(device_config, debug, suppress_failures_during_listening)
-                    connection_tasks.append(("trainer", task))
-                elif self.trainer_device in self.connected_devices:
-                    connected = True  # Already connected
-            
-            elif any(s in ["Speed/Cadence", "Speed", "Cadence"] for s in device_config.services):
-                if not self.speed_cadence_device or not (self.speed_cadence_device.client and self.speed_cadence_device.client.is_connected):
-                    task = self._create_speed_cadence_connection_task(device_config, debug, suppress_failures_during_listening)
-                    connection_tasks.append(("speed_cadence", task))
-                elif self.speed_cadence_device in self.connected_devices:
-                    connected = True  # Already connected
-        
-        if not connection_tasks:
-            if connected:
-                # All devices already connected
-                return True
-            else:
-                if not suppress_failures_during_listening:
-                    console.log("[yellow]No devices configured to connect to[/yellow]")
-                return False
+        if not self.config.devices:
+            if not suppress_failures_during_listening:
+                console.log("[yellow]No devices configured to connect to[/yellow]")
+            return False
         
         if debug:
-            console.log(f"[dim]Attempting to connect to {len(connection_tasks)} device(s) concurrently...[/dim]")
-        
-        # Execute all connection tasks concurrently
-        tasks = [task for _, task in connection_tasks]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Process results
-        for i, (device_type, _) in enumerate(connection_tasks):
-            result = results[i]
+            console.log(f"[dim]Attempting to connect to {len(self.config.devices)} device(s) concurrently...[/dim]")
+        
+        # Connect all devices concurrently; ones that are already connected return immediately
+        results = await asyncio.gather(
+            *(self.connect_device(device_config, debug, suppress_failures_during_listening)
+              for device_config in self.config.devices),
+            return_exceptions=True
+        )
+        
+        # Process results, collecting debug errors into a single log call
+        errors = []
+        for device_config, result in zip(self.config.devices, results):
             if isinstance(result, Exception):
-                if debug:
-                    console.log(f"[red]✗ Error connecting to {device_type}: {result}[/red]")
+                errors.append(f"[red]✗ Error connecting to {device_config.name}: {result}[/red]")
             elif result:
                 connected = True
+        if debug and errors:
+            console.log("\n".join(errors))
         
         if connected:
             if debug:
@@ -197,88 +186,58 @@ class DeviceController:
         
         return connected
     
-    async def _create_heart_rate_connection_task(self, device_config, debug, suppress_failures_during_listening):
-        """Create a task for connecting to a heart rate device."""
-        if debug:
-            console.log(f"[dim]Connecting to heart rate monitor: {device_config.name}...[/dim]")
+    async def connect_device(self, device_config: DeviceConfig, debug: bool = False, suppress_failures_during_listening: bool = False) -> bool:
+        """Connect to a single configured device according to its device type.
         
-        # Reuse existing device object if it exists
-        if not self.heart_rate_device:
-            self.heart_rate_device = HeartRateDevice(
-                device_name=device_config.name,
-                data_callback=self.handle_metric_data
-            )
-            await self.heart_rate_device.set_callbacks(
-                disconnect_callback=self.handle_device_disconnect,
-                reconnect_callback=self.handle_device_reconnect
-            )
+        Args:
+            device_config: The configured device to connect to
+            debug: Whether to enable debug output
+            suppress_failures_during_listening: Don't report failed attempts
         
-        if await self.heart_rate_device.connect(address=device_config.address, debug=debug):
-            if self.heart_rate_device not in self.connected_devices:
-                self.connected_devices.append(self.heart_rate_device)
-            console.log(f"[green]✓ Connected to {device_config.name}[/green]")
-            return True
-        else:
-            if not suppress_failures_during_listening:
-                console.log(f"[red]✗ Failed to connect to {device_config.name}[/red]")
+        Returns:
+            True if the device is connected, including if it already was
+        """
+        # Controller attribute, device class and log label for each device type
+        spec = {
+            "Heart Rate Monitor": ("heart_rate_device", HeartRateDevice, "heart rate monitor"),
+            "Trainer/Power Meter": ("trainer_device", TrainerDevice, "trainer"),
+            "Speed/Cadence Sensor": ("speed_cadence_device", SpeedCadenceDevice, "speed/cadence sensor"),
+        }.get(device_config.device_type)
+        if spec is None:
             return False
-    
-    async def _create_trainer_connection_task(self, device_config, debug, suppress_failures_during_listening):
-        """Create a task for connecting to a trainer device."""
-        if debug:
-            console.log(f"[dim]Connecting to trainer: {device_config.name}...[/dim]")
+        attr, device_class, label = spec
         
-        # Reuse existing device object if it exists
-        if not self.trainer_device:
-            # Find all metrics that should come from this trainer
-            trainer_metrics = set()  # Use a set to avoid duplicates
-            for metric in self.config.display:
-                if metric.device == device_config.name:
-                    trainer_metrics.add(metric.metric)  # Use the internal metric name
-            
-            trainer_metrics = list(trainer_metrics)  # Convert back to list
-            if debug:
-                console.log(f"[dim]Configured metrics for trainer: {trainer_metrics}[/dim]")
-            
-            self.trainer_device = TrainerDevice(
-                device_name=device_config.name,
-                data_callback=self.handle_metric_data,
-                metrics=trainer_metrics  # Pass the list of metrics to monitor
-            )
-            await self.trainer_device.set_callbacks(
-                disconnect_callback=self.handle_device_disconnect,
-                reconnect_callback=self.handle_device_reconnect
-            )
+        device = getattr(self, attr)
+        if device and device.client and device.client.is_connected:
+            return device in self.connected_devices
         
-        if await self.trainer_device.connect(address=device_config.address, debug=debug):
-            if self.trainer_device not in self.connected_devices:
-                self.connected_devices.append(self.trainer_device)
-            console.log(f"[green]✓ Connected to {device_config.name}[/green]")
-            return True
-        else:
-            if not suppress_failures_during_listening:
-                console.log(f"[red]✗ Failed to connect to {device_config.name}[/red]")
-            return False
-    
-    async def _create_speed_cadence_connection_task(self, device_config, debug, suppress_failures_during_listening):
-        """Create a task for connecting to a speed/cadence device."""
+        self.debug_mode = debug
         if debug:
-            console.log(f"[dim]Connecting to speed/cadence sensor: {device_config.name}...[/dim]")
+            console.log(f"[dim]Connecting to {label}: {device_config.name}...[/dim]")
         
         # Reuse existing device object if it exists
-        if not self.speed_cadence_device:
-            self.speed_cadence_device = SpeedCadenceDevice(
+        if not device:
+            kwargs = {}
+            if attr == "trainer_device":
+                # All metrics that should come from this trainer (internal names)
+                kwargs["metrics"] = list(self._device_metrics.get(device_config.name, ()))
+                if debug:
+                    console.log(f"[dim]Configured metrics for trainer: {kwargs['metrics']}[/dim]")
+            
+            device = device_class(
                 device_name=device_config.name,
-                data_callback=self.handle_metric_data
+                data_callback=self.handle_metric_data,
+                **kwargs
             )
-            await self.speed_cadence_device.set_callbacks(
+            setattr(self, attr, device)
+            await device.set_callbacks(
                 disconnect_callback=self.handle_device_disconnect,
                 reconnect_callback=self.handle_device_reconnect
             )
         
-        if await self.speed_cadence_device.connect(address=device_config.address, debug=debug):
-            if self.speed_cadence_device not in self.connected_devices:
-                self.connected_devices.append(self.speed_cadence_device)
+        if await device.connect(address=device_config.address, debug=debug):
+            if device not in self.connected_devices:
+                self.connected_devices.append(device)
             console.log(f"[green]✓ Connected to {device_config.name}[/green]")
             return True
         else:
@@ -297,22 +256,27 @@ class DeviceController:
         try:
             # Initialize display if needed
             if self.show_display:
+                from .display import MultiMetricDisplay
                 monitors = list(self.metric_monitors.values())
                 self.multi_display = MultiMetricDisplay(monitors)
                 self.multi_display.start_display()
             
-            # Keep running until stopped
-            while self.running:
-                await asyncio.sleep(refresh_rate)
+            # Keep running until stop() is called
+            await self._stop_event.wait()
                 
         except asyncio.CancelledError:
             self.running = False
         finally:
             await self.disconnect_devices()
     
+    def stop(self):
+        """Stop a running controller; must be called on its event loop."""
+        self.running = False
+        self._stop_event.set()
+    
     async def disconnect_devices(self):
         """Disconnect from all connected devices."""
-        self.running = False
+        self.stop()
         
         if self.multi_display:
             try:
@@ -321,15 +285,29 @@ class DeviceController:
                 if self.debug_mode:
                     console.log(f"[yellow]Warning: Error stopping display: {e}[/yellow]")
         
-        # Disconnect devices one by one with error handling
-        for device in self.connected_devices[:]:  # Copy list to avoid modification during iteration
-            try:
-                device_name = getattr(device, 'device_name', 'Unknown')
-                console.log(f"[dim]Disconnecting {device_name}...[/dim]")
-                await device.disconnect()
+        # Disconnect all devices concurrently so shutdown waits for the slowest
+        # device rather than the sum of them; one failure doesn't stop the rest
+        devices = self.connected_devices[:]  # Copy list to avoid modification during disconnect
+        for device in devices:
+            console.log(f"[dim]Disconnecting {getattr(device, 'device_name', 'Unknown')}...[/dim]")
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    *(device.disconnect() for device in devices),
+                    return_exceptions=True
+                ),
+                timeout=DISCONNECT_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            # A hung BLE stack must not block shutdown; wait_for cancelled the rest
+            console.log(f"[yellow]Warning: Timed out disconnecting devices after {DISCONNECT_TIMEOUT:g}s[/yellow]")
+            results = []
+        for device, result in zip(devices, results):
+            device_name = getattr(device, 'device_name', 'Unknown')
+            if isinstance(result, Exception):
+                console.log(f"[yellow]Warning: Error disconnecting {device_name}: {result}[/yellow]")
+            else:
                 console.log(f"[dim]✓ Disconnected {device_name}[/dim]")
-            except Exception as e:
-                console.log(f"[yellow]Warning: Error disconnecting device: {e}[/yellow]")
         
         self.connected_devices = []
         
@@ -383,6 +361,17 @@ class DeviceController:
         
         return status
 
+def install_uvloop():
+    """Use uvloop for the asyncio event loop when it is installed.
+    
+    uvloop is not available on Windows; the default asyncio loop is kept there.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 def start_monitoring_with_config(
     config: Config,
     refresh_rate: int = 1,
@@ -391,11 +380,14 @@ def start_monitoring_with_config(
     """Start monitoring using the provided configuration."""
     try:
         controller = DeviceController(config, show_display=True)
-        
-        # Run everything in an async event loop
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(controller.connect_configured_devices(debug=debug))
-        loop.run_until_complete(controller.run(refresh_rate=refresh_rate))
+
+        # One loop for connect and monitor; run() disconnects on exit
+        async def monitor():
+            await controller.connect_configured_devices(debug=debug)
+            await controller.run(refresh_rate=refresh_rate)
+
+        install_uvloop()
+        asyncio.run(monitor())
         
     except KeyboardInterrupt:
         console.print("\n[yellow]Monitoring stopped by user[/yellow]")
@@ -2,35 +2,65 @@
 
 import time
 from typing import Dict, Optional, Any
-from collections import defaultdict
+
+
+def _round_to_int(value: Any) -> int:
+    """Round a numeric metric to an integer."""
+    return round(float(value))
+
+
+def _round_to_tenth(value: Any) -> float:
+    """Round a numeric metric to one decimal place."""
+    return round(float(value), 1)
+
+
+# Formatter for each metric; metrics not listed are rounded to integers
+METRIC_FORMATTERS = {
+    "speed": _round_to_tenth,
+}
 
 class DataProcessor:
     """Process and buffer cycling metrics data."""
     
+    __slots__ = ("current_values", "last_update_time", "stale_threshold")
+    
     def __init__(self, stale_threshold: float = 2.0):
         """Initialize the data processor.
         
         Args:
             stale_threshold: Number of seconds after which data is considered stale
         """
-        self.current_values = defaultdict(lambda: None)
-        self.last_update_time = defaultdict(float)
+        self.current_values: Dict[str, Any] = {}
+        self.last_update_time: Dict[str, float] = {}  # time.monotonic() of last update
         self.stale_threshold = stale_threshold
         
     def update_metric(self, metric_name: str, value: Any):
         """Update a metric with a new value."""
-        # Format speed with one decimal point
-        if metric_name == "speed" and value is not None:
-            value = round(float(value), 1)
-        else:
-            # Round other numeric metrics to integers
+        try:
+            value = METRIC_FORMATTERS.get(metric_name, _round_to_int)(value)
+        except (TypeError, ValueError):
+            pass  # Keep original value if not numeric
+        
+        self.current_values[metric_name] = value
+        self.last_update_time[metric_name] = time.monotonic()
+    
+    def update_metrics(self, metrics: Dict[str, Any]):
+        """Update several metrics at once, stamping them with a single clock read.
+        
+        Args:
+            metrics: Dictionary of metric name -> value
+        """
+        now = time.monotonic()
+        current_values = self.current_values
+        last_update_time = self.last_update_time
+        for metric_name, value in metrics.items():
             try:
-                value = round(float(value))
+                value = METRIC_FORMATTERS.get(metric_name, _round_to_int)(value)
             except (TypeError, ValueError):
                 pass  # Keep original value if not numeric
-                
-        self.current_values[metric_name] = value
-        self.last_update_time[metric_name] = time.time()
+            
+            current_values[metric_name] = value
+            last_update_time[metric_name] = now
     
     def get_processed_metrics(self) -> Dict[str, Any]:
         """Get all current metrics, handling stale data.
@@ -41,35 +71,29 @@ class DataProcessor:
             - For cadence: returns 0 (not pedaling)
             - For other metrics: returns the last known value
         """
-        current_time = time.time()
-        processed_metrics = {}
-        
         if not self.current_values:
             return {}
 
-        for metric, value in self.current_values.items():
-            time_since_update = current_time - self.last_update_time.get(metric, current_time)
-            
-            if time_since_update > self.stale_threshold:
-                # Handle stale data differently based on metric type
-                if metric == "cadence":
-                    processed_metrics[metric] = 0  # Not pedaling
-                else:
-                    processed_metrics[metric] = value  # Keep last known value
-            else:
-                processed_metrics[metric] = value
+        current_time = time.monotonic()
+        last_update_time = self.last_update_time
+        
+        # Stale metrics keep their last known value, so start from a copy of
+        # the current values and only override stale cadence (not pedaling)
+        processed_metrics = self.current_values.copy()
+        cadence_time = last_update_time.get("cadence")
+        if cadence_time is not None and current_time - cadence_time > self.stale_threshold:
+            processed_metrics["cadence"] = 0
         
         # Don't clear metrics immediately - let them stay for continuous streaming
         # Only clear metrics that are very old (much older than stale_threshold)
         very_old_threshold = self.stale_threshold * 10  # 20 seconds by default
-        metrics_to_remove = []
-        for metric in self.current_values:
-            time_since_update = current_time - self.last_update_time.get(metric, current_time)
-            if time_since_update > very_old_threshold:
-                metrics_to_remove.append(metric)
-        
-        for metric in metrics_to_remove:
-            del self.current_values[metric]
-            del self.last_update_time[metric]
+        if current_time - min(last_update_time.values()) > very_old_threshold:
+            metrics_to_remove = [
+                metric for metric, updated in last_update_time.items()
+                if current_time - updated > very_old_threshold
+            ]
+            for metric in metrics_to_remove:
+                del self.current_values[metric]
+                del last_update_time[metric]
                 
-        return processed_metrics 
\ No newline at end of file
+        return processed_metrics
@@ -11,6 +11,34 @@ from .config import Config
 
 console = Console()
 
+def is_device_name_match(discovered_lower: str, target_lower: str) -> bool:
+    """Check if a discovered device name matches a configured device name.
+    
+    Args:
+        discovered_lower: Lowercased name of the discovered device
+        target_lower: Lowercased name of the target device
+    """
+    # Exact match
+    if discovered_lower == target_lower:
+        return True
+    
+    # Substring match (either direction)
+    if target_lower in discovered_lower or discovered_lower in target_lower:
+        return True
+    
+    # Handle common device naming patterns
+    # E.g., "Wahoo CADENCE D9E1" matches "CADENCE D9E1"
+    target_words = target_lower.split()
+    discovered_words = discovered_lower.split()
+    
+    # Check if all target words are in discovered name
+    if len(target_words) <= len(discovered_words):
+        if all(word in discovered_words for word in target_words):
+            return True
+    
+    return False
+
+
 class SmartDeviceManager:
     """Smart device manager with enhanced connection strategies."""
     
@@ -69,7 +97,7 @@ class SmartDeviceManager:
                         'name': device.name,
                         'address': device.address,
                         'rssi': adv_data.rssi,
-                        'last_seen': asyncio.get_event_loop().time()
+                        'last_seen': asyncio.get_running_loop().time()
                     }
             
             return discovered
@@ -80,14 +108,17 @@ class SmartDeviceManager:
     def _match_target_devices(self, discovered: Dict, remaining_devices: Set[str], found_devices: Dict) -> int:
         """Match discovered devices to target devices."""
         found_count = 0
+        # Lowercase each name once rather than on every comparison
+        targets_lower = {target_name: target_name.lower() for target_name in remaining_devices}
         
         for device, adv_data in discovered.values():
             if not device.name:
                 continue
+            discovered_lower = device.name.lower()
                 
             # Check if this device matches any remaining target
             for target_name in list(remaining_devices):
-                if self._is_device_match(device.name, target_name):
+                if self._is_device_match(discovered_lower, targets_lower[target_name]):
                     found_devices[target_name] = {
                         'device': device,
                         'adv_data': adv_data,
@@ -100,30 +131,9 @@ class SmartDeviceManager:
         
         return found_count
     
-    def _is_device_match(self, discovered_name: str, target_name: str) -> bool:
+    def _is_device_match(self, discovered_lower: str, target_lower: str) -> bool:
         """Check if a discovered device matches a target device."""
-        discovered_lower = discovered_name.lower()
-        target_lower = target_name.lower()
-        
-        # Exact match
-        if discovered_lower == target_lower:
-            return True
-        
-        # Substring match (either direction)
-        if target_lower in discovered_lower or discovered_lower in target_lower:
-            return True
-        
-        # Handle common device naming patterns
-        # E.g., "Wahoo CADENCE D9E1" matches "CADENCE D9E1"
-        target_words = target_lower.split()
-        discovered_words = discovered_lower.split()
-        
-        # Check if all target words are in discovered name
-        if len(target_words) <= len(discovered_words):
-            if all(word in discovered_words for word in target_words):
-                return True
-        
-        return False
+        return is_device_name_match(discovered_lower, target_lower)
     
     def _show_device_wake_guidance(self, missing_devices: Set[str]):
         """Show guidance for waking up missing devices."""
@@ -23,7 +23,7 @@ class Device:
         self.device = None
         self.client = None
         self.debug_mode = False
-        self.available_metrics = []
+        self.available_metrics: Dict[str, None] = {}  # Ordered set of reported metrics
         self.current_values = {}
         self._debug_messages = []
         self._last_known_address = None
@@ -116,35 +116,46 @@ class Device:
         """
         console.log(f"[blue]🔍 Searching for {self.device_name or self.__class__.__name__}...[/blue]")
         
-        # If we have a device name, try multiple scan attempts with different timeouts
+        # Scans stop as soon as a matching advertisement arrives rather than
+        # running for the full timeout, so connecting starts right away
         if self.device_name:
+            target_name = self.device_name.lower()
+            
+            def matches_name(device, adv_data):
+                # Flexible name matching
+                if not device.name:
+                    return False
+                name = device.name.lower()
+                return target_name in name or name in target_name
+            
+            # Try multiple scan attempts with different timeouts
             scan_attempts = [3, 5, 8]  # Progressive scan timeout
             for attempt, timeout in enumerate(scan_attempts, 1):
                 console.log(f"[dim]Scan attempt {attempt}/{len(scan_attempts)} (timeout: {timeout}s)[/dim]")
                 
-                discovered = await BleakScanner.discover(timeout=timeout, return_adv=True)
-                
-                for device, adv_data in discovered.values():
-                    if device.name:
-                        # Flexible name matching
-                        if (self.device_name.lower() in device.name.lower() or 
-                            device.name.lower() in self.device_name.lower()):
-                            console.log(f"[green]✓ Found device: {device.name} ({device.address})[/green]")
-                            return device
+                device = await BleakScanner.find_device_by_filter(matches_name, timeout=timeout)
+                if device:
+                    console.log(f"[green]✓ Found device: {device.name} ({device.address})[/green]")
+                    return device
                 
                 if attempt < len(scan_attempts):
                     console.log(f"[yellow]Device not found in scan {attempt}, retrying with longer timeout...[/yellow]")
                     await asyncio.sleep(1)  # Brief pause between scans
         else:
-            # Original service-based discovery with longer timeout
-            discovered = await BleakScanner.discover(timeout=self._scan_timeout, return_adv=True)
+            # Service-based discovery with longer timeout. The scanner's
+            # service_uuids filter lets the OS BLE stack drop other adverts;
+            # the callback still checks, as not every backend filters strictly
+            target_uuid = service_uuid.lower()
             
-            for device, adv_data in discovered.values():
-                if adv_data.service_uuids:
-                    uuids = [str(uuid).lower() for uuid in adv_data.service_uuids]
-                    if service_uuid.lower() in uuids:
-                        console.log(f"[green]✓ Found {self.__class__.__name__}: {device.name or 'Unknown'}[/green]")
-                        return device
+            def matches_service(device, adv_data):
+                return any(str(uuid).lower() == target_uuid for uuid in adv_data.service_uuids)
+            
+            device = await BleakScanner.find_device_by_filter(
+                matches_service, timeout=self._scan_timeout, service_uuids=[service_uuid]
+            )
+            if device:
+                console.log(f"[green]✓ Found {self.__class__.__name__}: {device.name or 'Unknown'}[/green]")
+                return device
         
         # Enhanced user guidance
         device_type = self.__class__.__name__.replace("Device", "")
@@ -294,8 +305,8 @@ class Device:
     def get_available_metrics(self) -> List[str]:
         """Return list of available metrics from this device."""
         if self.debug_mode:
-            self.add_debug_message(f"Available metrics: {self.available_metrics}")
-        return self.available_metrics
+            self.add_debug_message(f"Available metrics: {list(self.available_metrics)}")
+        return list(self.available_metrics)
     
     def get_current_values(self) -> Dict[str, Any]:
         """Return dictionary of current values."""
@@ -1,8 +1,6 @@
 """Heart rate monitor device."""
 
 import asyncio
-from bleak import BleakClient, BleakScanner
-from rich.console import Console
 from typing import Optional, Callable, List, Dict, Any
 from .base import Device
 
@@ -10,8 +8,6 @@ from .base import Device
 HEART_RATE_SERVICE = "0000180d-0000-1000-8000-00805f9b34fb"
 HEART_RATE_MEASUREMENT = "00002a37-0000-1000-8000-00805f9b34fb"
 
-console = Console()
-
 class HeartRateDevice(Device):
     """Heart rate monitor device."""
     
@@ -37,24 +33,27 @@ class HeartRateDevice(Device):
             self.handle_data
         )
         
-        # Initialize with a zero value to ensure the metric is available
-        if self.data_callback:
-            self.data_callback("heart_rate", 0, asyncio.get_event_loop().time())
+        # No placeholder sample is sent here: a synthetic zero would be recorded
+        # as a real reading, and the first notification follows within a second
         
         # Add heart rate to available metrics
         if "heart_rate" not in self.available_metrics:
-            self.available_metrics.append("heart_rate")
+            self.available_metrics["heart_rate"] = None
     
     def handle_data(self, _, data: bytearray):
         """Handle incoming heart rate data."""
+        if len(data) < 2:
+            return  # Ignore truncated frames
         flags = data[0]
         if flags & 0x1:  # If first bit is set, value is uint16
-            heart_rate = int.from_bytes(data[1:3], byteorder='little')
+            if len(data) < 3:
+                return
+            heart_rate = data[1] | (data[2] << 8)  # Little-endian, no slice
         else:  # Value is uint8
             heart_rate = data[1]
         
         self.current_values["heart_rate"] = heart_rate
-        timestamp = asyncio.get_event_loop().time()
+        timestamp = asyncio.get_running_loop().time()
         
         # Call the callback if provided
         if self.data_callback:
@@ -42,7 +42,7 @@ class MockDevice(Device):
         self._update_task = None
         
         # Available metrics
-        self.available_metrics = ["power", "speed", "cadence", "heart_rate"]
+        self.available_metrics = dict.fromkeys(["power", "speed", "cadence", "heart_rate"])
     
     def get_service_uuid(self) -> str:
         """Return a fake service UUID."""
@@ -52,7 +52,7 @@ class MockDevice(Device):
         """Simulate connecting to the device."""
         self.debug_mode = debug
         console.print(f"[blue][MockDevice] connect called. Debug: {self.debug_mode}[/blue]")
-        self._start_time = asyncio.get_event_loop().time()
+        self._start_time = asyncio.get_running_loop().time()
         
         # Start the simulation task
         try:
@@ -91,7 +91,7 @@ class MockDevice(Device):
         try:
             while True:
                 timestamp = time.time()
-                current_loop_time = asyncio.get_event_loop().time()
+                current_loop_time = asyncio.get_running_loop().time()
                 elapsed = current_loop_time - self._start_time
                 
                 # Add some sinusoidal variation to make it more realistic
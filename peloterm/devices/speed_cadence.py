@@ -89,12 +89,12 @@ class SpeedCadenceDevice(Device):
             if self.client.is_connected:
                 for service in services:
                     for char in service.characteristics:
-                        if char.uuid.lower() == CSC_MEASUREMENT.lower():
+                        if char.uuid.lower() == CSC_MEASUREMENT:
                             await self.client.start_notify(
                                 CSC_MEASUREMENT,
-                                lambda _, data: self.handle_data(CSC_MEASUREMENT.lower(), data)
+                                lambda _, data: self.handle_data(CSC_MEASUREMENT, data)
                             )
-                            self._active_notifications.add(CSC_MEASUREMENT.lower())
+                            self._active_notifications.add(CSC_MEASUREMENT)
                             console.log("[green]✓ Enabled CSC notifications[/green]")
                             break
         except Exception as e:
@@ -194,14 +194,14 @@ class SpeedCadenceDevice(Device):
         if self.debug_mode:
             self.add_debug_message("No data received, adding test cadence metric...")
         
-        timestamp = asyncio.get_event_loop().time()
+        timestamp = asyncio.get_running_loop().time()
         
         # Add a dummy cadence value of 0 RPM
         self.current_values["cadence"] = 0
         if self.data_callback:
             self.data_callback("cadence", 0, timestamp)
         if "cadence" not in self.available_metrics:
-            self.available_metrics.append("cadence")
+            self.available_metrics["cadence"] = None
             if self.debug_mode:
                 self.add_debug_message("Added dummy cadence metric: 0 RPM")
     
@@ -245,10 +245,12 @@ class SpeedCadenceDevice(Device):
     
     def handle_data(self, char_uuid: str, data: bytearray):
         """Handle data from any characteristic."""
-        # This method will call the appropriate specific handler
-        if "wahoo" in char_uuid.lower() or char_uuid.lower() == WAHOO_DATA_CHAR.lower():
+        # This method will call the appropriate specific handler; the UUID
+        # constants are already lowercase, so normalize the incoming UUID once
+        char_uuid_lower = char_uuid.lower()
+        if "wahoo" in char_uuid_lower or char_uuid_lower == WAHOO_DATA_CHAR:
             self.parse_wahoo_data(data)
-        elif char_uuid.lower() == CSC_MEASUREMENT.lower():
+        elif char_uuid_lower == CSC_MEASUREMENT:
             self.handle_csc_measurement(data)
         else:
             self.handle_generic_data(char_uuid, data) # Keep generic for unknown
@@ -261,9 +263,10 @@ class SpeedCadenceDevice(Device):
                 self.add_debug_message(f"Received data from {char_uuid}: {hex_data}")
             
             # For Wahoo, try to parse as cadence
-            if "wahoo" in char_uuid.lower() or char_uuid.lower() == WAHOO_DATA_CHAR.lower():
+            char_uuid_lower = char_uuid.lower()
+            if "wahoo" in char_uuid_lower or char_uuid_lower == WAHOO_DATA_CHAR:
                 self.parse_wahoo_data(data)
-            elif char_uuid.lower() == CSC_MEASUREMENT.lower():
+            elif char_uuid_lower == CSC_MEASUREMENT:
                 self.handle_csc_measurement(data)
             else:
                 # For unknown characteristics, check if this looks like cadence data
@@ -277,11 +280,11 @@ class SpeedCadenceDevice(Device):
                             
                             # Record this as cadence if reasonable
                             self.current_values["cadence"] = value
-                            timestamp = asyncio.get_event_loop().time()
+                            timestamp = asyncio.get_running_loop().time()
                             if self.data_callback:
                                 self.data_callback("cadence", value, timestamp)
                             if "cadence" not in self.available_metrics:
-                                self.available_metrics.append("cadence")
+                                self.available_metrics["cadence"] = None
                                 if self.debug_mode:
                                     self.add_debug_message(f"Added cadence metric from unknown characteristic: {value} RPM")
             
@@ -294,7 +297,7 @@ class SpeedCadenceDevice(Device):
     def parse_wahoo_data(self, data: bytearray):
         """Parse Wahoo specific data format."""
         try:
-            timestamp = asyncio.get_event_loop().time()
+            timestamp = asyncio.get_running_loop().time()
             
             # Wahoo format can vary by device, but often the cadence is a single byte or a uint16
             if len(data) >= 1:
@@ -307,7 +310,7 @@ class SpeedCadenceDevice(Device):
                     if self.data_callback:
                         self.data_callback("cadence", value, timestamp)
                     if "cadence" not in self.available_metrics:
-                        self.available_metrics.append("cadence")
+                        self.available_metrics["cadence"] = None
                         if self.debug_mode:
                             self.add_debug_message(f"Added cadence metric from Wahoo: {value} RPM")
             
@@ -321,7 +324,7 @@ class SpeedCadenceDevice(Device):
                     if self.data_callback:
                         self.data_callback("cadence", value, timestamp)
                     if "cadence" not in self.available_metrics:
-                        self.available_metrics.append("cadence")
+                        self.available_metrics["cadence"] = None
                         if self.debug_mode:
                             self.add_debug_message(f"Added cadence metric from Wahoo: {value} RPM")
             
@@ -343,7 +346,7 @@ class SpeedCadenceDevice(Device):
             if self.debug_mode:
                 self.add_debug_message(f"Data flags - Speed: {has_speed}, Cadence: {has_cadence}")
             
-            timestamp = asyncio.get_event_loop().time()
+            timestamp = asyncio.get_running_loop().time()
             
             i = 1  # Start after flags byte
             
@@ -388,7 +391,7 @@ class SpeedCadenceDevice(Device):
                         if self.data_callback:
                             self.data_callback("cadence", round(cadence), timestamp)
                         if "cadence" not in self.available_metrics:
-                            self.available_metrics.append("cadence")
+                            self.available_metrics["cadence"] = None
                             if self.debug_mode:
                                 self.add_debug_message(f"Added cadence metric: {round(cadence)} RPM")
                 else:
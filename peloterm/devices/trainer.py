@@ -109,7 +109,7 @@ class InsideRideTrainerDevice(Device):
             if self.debug_mode:
                 self.add_debug_message(f"Parsed bike data: {bike_data}")
                 
-            timestamp = asyncio.get_event_loop().time()
+            timestamp = asyncio.get_running_loop().time()
             
             # Update current values and notify callback for each available metric
             if bike_data.instant_power is not None and "power" in self.metrics:
@@ -117,7 +117,7 @@ class InsideRideTrainerDevice(Device):
                 if self.data_callback:
                     self.data_callback("power", bike_data.instant_power, timestamp)
                 if "power" not in self.available_metrics:
-                    self.available_metrics.append("power")
+                    self.available_metrics["power"] = None
                     if self.debug_mode:
                         self.add_debug_message(f"Added power metric: {bike_data.instant_power} W")
             
@@ -126,7 +126,7 @@ class InsideRideTrainerDevice(Device):
                 if self.data_callback:
                     self.data_callback("speed", bike_data.instant_speed, timestamp)
                 if "speed" not in self.available_metrics:
-                    self.available_metrics.append("speed")
+                    self.available_metrics["speed"] = None
                     if self.debug_mode:
                         self.add_debug_message(f"Added speed metric: {bike_data.instant_speed:.1f} km/h")
             
@@ -141,7 +141,7 @@ class InsideRideTrainerDevice(Device):
                 if self.data_callback:
                     self.data_callback("elapsed_time", bike_data.elapsed_time, timestamp)
                 if "elapsed_time" not in self.available_metrics:
-                    self.available_metrics.append("elapsed_time")
+                    self.available_metrics["elapsed_time"] = None
                     if self.debug_mode:
                         self.add_debug_message(f"Added elapsed time metric: {bike_data.elapsed_time} s")
             
@@ -151,7 +151,7 @@ class InsideRideTrainerDevice(Device):
                 if self.data_callback:
                     self.data_callback("resistance", bike_data.resistance_level, timestamp)
                 if "resistance" not in self.available_metrics:
-                    self.available_metrics.append("resistance")
+                    self.available_metrics["resistance"] = None
                     if self.debug_mode:
                         self.add_debug_message(f"Added resistance metric: {bike_data.resistance_level}")
                 
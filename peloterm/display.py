@@ -32,10 +32,15 @@ class MetricMonitor:
         
     
     def update_value(self, value: float):
-        """Update metric value and timestamps."""
+        """Update metric value and timestamps, keeping a bounded history."""
         self.current_value = value
         self.values.append(value)
         self.timestamps.append(datetime.now())
+        
+        # Trim in batches so a long ride doesn't grow the history forever
+        if len(self.values) > 2 * self.initial_capacity:
+            del self.values[:-self.initial_capacity]
+            del self.timestamps[:-self.initial_capacity]
 
 class MultiMetricDisplay:
     """A display for multiple metrics shown simultaneously."""
@@ -81,7 +86,9 @@ class MultiMetricDisplay:
     
     def start_display(self):
         """Start the live display."""
-        self.live = Live(self.update_display(), refresh_per_second=1, console=console)
+        # Live rebuilds the view on each refresh, so new samples don't each
+        # trigger a render and the latest values always show
+        self.live = Live(get_renderable=self.update_display, refresh_per_second=1, console=console)
         self.live.start()
     
     def stop_display(self):
@@ -1,7 +1,6 @@
 """ASCII logo and branding for Peloterm."""
 
 from rich.console import Console
-from rich.panel import Panel
 from rich.text import Text
 
 def get_logo() -> str:
@@ -75,6 +74,7 @@ def display_logo(console: Console = None, style: str = "banner") -> None:
         text.stylize("bold blue")
         console.print(text)
     elif style == "compact":
+        from rich.panel import Panel
         console.print(Panel(get_compact_logo(), style="bold blue"))
     elif style == "logo":
         text = Text(get_logo())
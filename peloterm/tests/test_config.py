@@ -1,5 +1,6 @@
 """Tests for the configuration module."""
 
+import os
 import pytest
 from pathlib import Path
 import yaml
@@ -184,4 +185,71 @@ def test_load_config_missing_file(tmp_path):
     """Test loading configuration from non-existent file."""
     non_existent_path = tmp_path / 'does_not_exist.yaml'
     with pytest.raises(FileNotFoundError):
-        load_config(non_existent_path) 
\ No newline at end of file
+        load_config(non_existent_path) 
+
+def test_metrics_by_device(sample_config_dict):
+    """Test indexing display metrics by their source device."""
+    config = Config.load(sample_config_dict)
+    index = config.metrics_by_device()
+    
+    assert index == {
+        'Wahoo KICKR': ['Power ⚡'],
+        'Polar H10': ['Heart Rate 💓'],
+    }
+
+def test_device_config_device_type():
+    """Test deriving the device type from the configured services."""
+    assert DeviceConfig('HR', 'a', ['Heart Rate']).device_type == 'Heart Rate Monitor'
+    assert DeviceConfig('Trainer', 'b', ['Speed', 'Power']).device_type == 'Trainer/Power Meter'
+    assert DeviceConfig('Sensor', 'c', ['Cadence']).device_type == 'Speed/Cadence Sensor'
+    assert DeviceConfig('Other', 'd', ['Battery']).device_type == 'Unknown'
+
+    device = DeviceConfig('Sensor', 'e', ['Battery'])
+    device.services.append('Heart Rate')
+    assert device.device_type == 'Heart Rate Monitor'
+
+def test_save_config_replaces_existing_file(tmp_path, sample_config_dict):
+    """Test that saving over an existing config replaces it without leftovers."""
+    config_path = tmp_path / 'config.yaml'
+    config_path.write_text('devices: []\n')
+    
+    save_config(Config.load(sample_config_dict), config_path)
+    
+    assert load_config(config_path).devices[0].name == 'Wahoo KICKR'
+    assert [p.name for p in tmp_path.iterdir()] == ['config.yaml']
+
+def test_save_config_keeps_permissions(tmp_path, sample_config_dict):
+    """Test that saving over an existing config keeps its file mode."""
+    config_path = tmp_path / 'config.yaml'
+    config_path.write_text('devices: []\n')
+    config_path.chmod(0o600)
+
+    save_config(Config.load(sample_config_dict), config_path)
+
+    assert config_path.stat().st_mode & 0o777 == 0o600
+
+def test_save_new_config_uses_umask_mode(tmp_path, sample_config_dict):
+    """Test that a newly created config gets the default mode for the umask."""
+    config_path = tmp_path / 'config.yaml'
+    umask = os.umask(0o022)
+    try:
+        save_config(Config.load(sample_config_dict), config_path)
+    finally:
+        os.umask(umask)
+
+    assert config_path.stat().st_mode & 0o777 == 0o644
+
+def test_save_config_cleans_up_on_failure(tmp_path, sample_config_dict, monkeypatch):
+    """Test that a failed save leaves the original config and no temp file."""
+    config_path = tmp_path / 'config.yaml'
+    config_path.write_text('devices: []\n')
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr('peloterm.config.os.replace', fail_replace)
+    with pytest.raises(OSError):
+        save_config(Config.load(sample_config_dict), config_path)
+
+    assert config_path.read_text() == 'devices: []\n'
+    assert [p.name for p in tmp_path.iterdir()] == ['config.yaml']
@@ -1,5 +1,6 @@
 """Tests for the controller module."""
 
+import asyncio
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
 from peloterm.controller import DeviceController
@@ -124,6 +125,28 @@ async def test_connect_configured_devices(
         mock_heart_rate_device.connect.assert_called_once()
         mock_trainer_device.connect.assert_called_once()
 
+@pytest.mark.asyncio
+async def test_connect_device(
+    sample_config,
+    mock_heart_rate_device,
+    mock_trainer_device
+):
+    """Test connecting a single device picks the device type from its services."""
+    with patch('peloterm.controller.HeartRateDevice', return_value=mock_heart_rate_device), \
+         patch('peloterm.controller.TrainerDevice', return_value=mock_trainer_device):
+        
+        controller = DeviceController(config=sample_config)
+        hr_config = next(d for d in sample_config.devices if "Heart Rate" in d.services)
+        
+        assert await controller.connect_device(hr_config)
+        assert controller.connected_devices == [mock_heart_rate_device]
+        mock_trainer_device.connect.assert_not_called()
+        
+        # An already connected device isn't connected again
+        mock_heart_rate_device.client.is_connected = True
+        assert await controller.connect_device(hr_config)
+        mock_heart_rate_device.connect.assert_called_once()
+
 @pytest.mark.asyncio
 async def test_handle_metric_data(sample_config):
     """Test handling metric data updates."""
@@ -162,6 +185,42 @@ async def test_disconnect_devices(
     mock_heart_rate_device.disconnect.assert_called_once()
     mock_trainer_device.disconnect.assert_called_once()
 
+@pytest.mark.asyncio
+async def test_disconnect_devices_continues_after_error(
+    sample_config,
+    mock_heart_rate_device,
+    mock_trainer_device
+):
+    """Test that a failing disconnect doesn't prevent the others."""
+    controller = DeviceController(config=sample_config)
+    mock_heart_rate_device.disconnect.side_effect = RuntimeError("BLE error")
+    controller.connected_devices = [mock_heart_rate_device, mock_trainer_device]
+    
+    await controller.disconnect_devices()
+    
+    assert len(controller.connected_devices) == 0
+    mock_trainer_device.disconnect.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_disconnect_devices_times_out(
+    sample_config,
+    mock_heart_rate_device,
+    mock_trainer_device
+):
+    """Test that a hung disconnect doesn't block shutdown."""
+    async def hang():
+        await asyncio.sleep(10)
+    
+    controller = DeviceController(config=sample_config)
+    mock_heart_rate_device.disconnect.side_effect = hang
+    controller.connected_devices = [mock_heart_rate_device, mock_trainer_device]
+    
+    with patch('peloterm.controller.DISCONNECT_TIMEOUT', 0.05):
+        await asyncio.wait_for(controller.disconnect_devices(), timeout=2)
+    
+    assert len(controller.connected_devices) == 0
+    mock_trainer_device.disconnect.assert_called_once()
+
 @pytest.mark.asyncio
 async def test_device_disconnect_handling(
     sample_config,
@@ -230,4 +289,31 @@ async def test_device_callbacks_registration(
         mock_trainer_device.set_callbacks.assert_awaited_once_with(
             disconnect_callback=controller.handle_device_disconnect,
             reconnect_callback=controller.handle_device_reconnect
-        ) 
\ No newline at end of file
+        ) 
+
+
+@pytest.mark.asyncio
+async def test_stop_ends_run(sample_config, mock_heart_rate_device):
+    """Test that stop() ends run() without waiting for the refresh interval."""
+    controller = DeviceController(config=sample_config, show_display=False)
+    controller.connected_devices.append(mock_heart_rate_device)
+    
+    run_task = asyncio.create_task(controller.run(refresh_rate=60))
+    await asyncio.sleep(0)
+    assert controller.running
+    
+    controller.stop()
+    await asyncio.wait_for(run_task, timeout=1)
+    
+    assert not controller.running
+    mock_heart_rate_device.disconnect.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_trainer_receives_configured_metrics(sample_config, mock_trainer_device):
+    """Test that the trainer is created with the metrics configured for it."""
+    with patch('peloterm.controller.TrainerDevice', return_value=mock_trainer_device) as trainer_cls:
+        controller = DeviceController(config=sample_config)
+        await controller.connect_device(sample_config.devices[1])
+    
+    assert trainer_cls.call_args.kwargs["metrics"] == ["power", "speed"]
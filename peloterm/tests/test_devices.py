@@ -4,6 +4,7 @@ import pytest
 import asyncio
 from unittest.mock import Mock, patch, AsyncMock
 from peloterm.devices.base import Device
+from peloterm.devices.heart_rate import HeartRateDevice
 
 class TestDevice:
     """Test the base Device class."""
@@ -160,4 +161,85 @@ class TestDevice:
             reconnect_callback.assert_not_awaited()
             
             # Verify exactly 2 retry attempts were made during reconnection
-            assert mock_client.connect.call_count == 6  # 2 reconnection attempts × 3 connection retries each = 6 total 
\ No newline at end of file
+            assert mock_client.connect.call_count == 6  # 2 reconnection attempts × 3 connection retries each = 6 total 
+
+    @pytest.mark.asyncio
+    async def test_find_device_returns_first_name_match(self, test_device, mock_device):
+        """Test that find_device stops scanning at the first matching advertisement."""
+        other_device = Mock()
+        other_device.name = "Other Sensor"
+        
+        async def find_device_by_filter(filterfunc, timeout):
+            for device in (other_device, mock_device):
+                if filterfunc(device, Mock()):
+                    return device
+            return None
+        
+        with patch('peloterm.devices.base.BleakScanner.find_device_by_filter', side_effect=find_device_by_filter) as find:
+            found = await test_device.find_device(test_device.get_service_uuid())
+        
+        assert found is mock_device
+        find.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_find_device_filters_scan_by_service(self, mock_device):
+        """Test that service-based discovery asks the scanner to filter by service UUID."""
+        class ServiceDeviceImpl(Device):
+            def get_service_uuid(self):
+                return "0000180D-0000-1000-8000-00805F9B34FB"
+            
+            async def setup_notifications(self):
+                return True
+        
+        device = ServiceDeviceImpl()
+        with patch('peloterm.devices.base.BleakScanner.find_device_by_filter', AsyncMock(return_value=mock_device)) as find:
+            found = await device.find_device(device.get_service_uuid())
+        
+        assert found is mock_device
+        filterfunc = find.call_args.args[0]
+        assert find.call_args.kwargs["service_uuids"] == [device.get_service_uuid()]
+        assert filterfunc(mock_device, Mock(service_uuids=["0000180d-0000-1000-8000-00805f9b34fb"]))
+        assert not filterfunc(mock_device, Mock(service_uuids=[]))
+
+
+class TestHeartRateDevice:
+    """Test the HeartRateDevice class."""
+
+    @pytest.mark.asyncio
+    async def test_parses_uint8_and_uint16(self):
+        """Test heart rate parsing for both measurement value formats."""
+        callback = Mock()
+        device = HeartRateDevice(data_callback=callback)
+
+        device.handle_data(None, bytearray([0x00, 72]))
+        assert device.current_values["heart_rate"] == 72
+
+        device.handle_data(None, bytearray([0x01, 0x2c, 0x01]))
+        assert device.current_values["heart_rate"] == 300
+        assert callback.call_args[0][:2] == ("heart_rate", 300)
+
+    @pytest.mark.asyncio
+    async def test_ignores_truncated_frames(self):
+        """Test that short measurement frames are dropped instead of raising."""
+        callback = Mock()
+        device = HeartRateDevice(data_callback=callback)
+
+        device.handle_data(None, bytearray([0x01, 0x2c]))
+        device.handle_data(None, bytearray([0x00]))
+        device.handle_data(None, bytearray())
+
+        callback.assert_not_called()
+        assert device.current_values["heart_rate"] is None
+
+    @pytest.mark.asyncio
+    async def test_setup_sends_no_placeholder_sample(self):
+        """Test that enabling notifications doesn't report a synthetic zero."""
+        callback = Mock()
+        device = HeartRateDevice(data_callback=callback)
+        device.client = AsyncMock()
+
+        await device.setup_notifications()
+
+        device.client.start_notify.assert_awaited_once()
+        callback.assert_not_called()
+        assert "heart_rate" in device.get_available_metrics()
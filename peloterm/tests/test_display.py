@@ -34,6 +34,17 @@ def test_metric_monitor_multiple_updates():
     assert len(monitor.values) == len(test_values)
     assert monitor.values == test_values
 
+def test_metric_monitor_history_is_bounded():
+    """Test that MetricMonitor keeps only a bounded window of history."""
+    monitor = MetricMonitor(name="Power", color="yellow", unit="W", window_size=10)
+    for value in range(100):
+        monitor.update_value(value)
+    
+    assert monitor.current_value == 99
+    assert len(monitor.values) <= 20
+    assert len(monitor.timestamps) == len(monitor.values)
+    assert monitor.values[-10:] == list(range(90, 100))
+
 def test_multi_metric_display_initialization():
     """Test MultiMetricDisplay initialization."""
     monitors = [
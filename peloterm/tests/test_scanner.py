@@ -83,6 +83,17 @@ async def test_discover_devices_unknown_name(mock_device, mock_adv_data):
         
         assert device["name"] == "Unknown"
 
+@pytest.mark.asyncio
+async def test_discover_devices_with_multiple_services(mock_device, mock_adv_data):
+    """Test that advertised services are reported in a fixed order."""
+    mock_adv_data.service_uuids = [CYCLING_SPEED_CADENCE.upper(), HEART_RATE_SERVICE.upper()]
+    
+    with patch('peloterm.scanner.BleakScanner.discover') as mock_discover:
+        mock_discover.return_value = {mock_device.address: (mock_device, mock_adv_data)}
+        
+        devices = await discover_devices(timeout=1)
+        assert devices[0]["services"] == ["Heart Rate", "Speed/Cadence"]
+
 def test_display_devices(capsys):
     """Test the display_devices function output."""
     test_devices = [{
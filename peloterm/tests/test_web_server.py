@@ -3,10 +3,15 @@
 import pytest
 import asyncio
 import json
+import socket
+import threading
 import time
+from unittest.mock import AsyncMock
 from fastapi.testclient import TestClient
 from fastapi.websockets import WebSocket
-from peloterm.web.server import WebServer, start_server, stop_server, broadcast_metrics
+from peloterm.web.server import (
+    WebServer, start_server, stop_server, serve_server, broadcast_metrics
+)
 from peloterm.data_processor import DataProcessor
 from peloterm.web.mock_data import MockDataGenerator, start_mock_data_stream
 
@@ -81,6 +86,23 @@ def test_config_endpoint(test_client):
     assert metric_keys == expected_metrics
 
 
+def test_config_endpoint_gzip(test_client):
+    """Test that larger JSON responses are gzip-compressed when accepted."""
+    response = test_client.get("/api/config", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers.get("content-encoding") == "gzip"
+    assert "metrics" in response.json()
+
+
+def test_compression_can_be_disabled():
+    """Test that compress=False leaves responses uncompressed."""
+    server = WebServer(compress=False)
+    client = TestClient(server.app)
+    response = client.get("/api/config", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+
+
 @pytest.mark.asyncio
 async def test_websocket_connection(web_server):
     """Test WebSocket connection and message broadcasting."""
@@ -201,6 +223,18 @@ async def test_real_time_websocket_data(web_server):
             pass
 
 
+def test_control_websocket_commands(test_client, web_server):
+    """Test that control commands are received and answered."""
+    with test_client.websocket_connect("/ws/control") as websocket:
+        status = websocket.receive_json()
+        assert status["type"] == "status"
+        assert status["is_recording"] is False
+        
+        websocket.send_text(json.dumps({"command": "start_recording"}))
+        assert websocket.receive_json() == {"type": "recording_started"}
+        assert web_server.is_recording
+
+
 @pytest.mark.asyncio
 async def test_server_shutdown(web_server):
     """Test proper server shutdown and cleanup using the web_server fixture."""
@@ -269,6 +303,32 @@ async def test_data_processor_integration(web_server):
         assert metrics[metric] == value
 
 
+def test_data_processor_update_metrics_batch():
+    """Test that a batch update formats values and stamps them together."""
+    processor = DataProcessor()
+    processor.update_metrics({"speed": 30.55, "power": 249.6, "heart_rate": None})
+    
+    assert processor.current_values == {"speed": 30.6, "power": 250, "heart_rate": None}
+    assert len(set(processor.last_update_time.values())) == 1
+
+
+def test_data_processor_stale_metrics():
+    """Test that stale cadence drops to zero and very old metrics are cleared."""
+    processor = DataProcessor(stale_threshold=2.0)
+    processor.update_metric("cadence", 90)
+    processor.update_metric("power", 250)
+    processor.update_metric("speed", 30.5)
+    
+    now = time.monotonic()
+    processor.last_update_time["cadence"] = now - 5
+    processor.last_update_time["power"] = now - 5
+    processor.last_update_time["speed"] = now - 60
+    
+    assert processor.get_processed_metrics() == {"cadence": 0, "power": 250, "speed": 30.5}
+    assert "speed" not in processor.current_values
+    assert processor.get_processed_metrics() == {"cadence": 0, "power": 250}
+
+
 @pytest.mark.asyncio
 async def test_mock_data_integration():
     """Test integration with mock data generator."""
@@ -324,4 +384,95 @@ async def test_broadcast_metrics_function():
         # Clean up global instance
         peloterm.web.server.web_server = original_global_web_server
         # Stop and clean up the update_task for this server
-        server.shutdown_event.set() 
\ No newline at end of file
+        server.shutdown_event.set() 
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch_interval, from_thread, steps, expected", [
+    # All samples queued before the drain ran arrive as one batch, latest value wins
+    (0.01, False, [{"power": 200}, {"cadence": 90}, {"power": 210}],
+     [{"power": 210, "cadence": 90}]),
+    # Samples queued from another thread wake the drain loop
+    (0.01, True, [0, {"power": 180}], [{"power": 180}]),
+    # The drain loop is mid-tick, so the second sample joins the first batch
+    (0.1, False, [{"power": 200}, 0.02, {"heart_rate": 140}],
+     [{"power": 200, "heart_rate": 140}]),
+], ids=["coalesces_batch", "from_thread", "batches_per_tick"])
+async def test_queue_metrics_batching(batch_interval, from_thread, steps, expected):
+    """Test that queued samples are drained into batched updates.
+    
+    Each step either queues a metrics dict or sleeps for that many seconds.
+    """
+    server = WebServer(
+        ride_duration_minutes=30, update_interval=0.01, batch_interval=batch_interval
+    )
+    batches = []
+    server.update_metrics = lambda metrics: batches.append(metrics)
+    
+    drain_task = asyncio.create_task(server.drain_loop())
+    try:
+        for step in steps:
+            if not isinstance(step, dict):
+                await asyncio.sleep(step)
+            elif from_thread:
+                thread = threading.Thread(target=server.queue_metrics, args=(step,))
+                thread.start()
+                thread.join()
+            else:
+                server.queue_metrics(step)
+        await asyncio.sleep(batch_interval + 0.05)
+        
+        assert batches == expected
+        assert not server.pending_metrics
+    finally:
+        server.shutdown_event.set()
+        drain_task.cancel()
+        try:
+            await drain_task
+        except asyncio.CancelledError:
+            pass
+
+
+@pytest.mark.asyncio
+async def test_broadcast_drops_failed_connections():
+    """Test that a failing client is removed without affecting the others."""
+    server = WebServer(ride_duration_minutes=30, update_interval=0.01)
+    healthy = AsyncMock()
+    broken = AsyncMock()
+    broken.send_text.side_effect = RuntimeError("connection lost")
+    server.active_connections = {healthy, broken}
+    
+    await server._broadcast_text(server.active_connections, "{}")
+    
+    healthy.send_text.assert_awaited_once_with("{}")
+    broken.close.assert_awaited_once()
+    assert server.active_connections == {healthy}
+
+
+@pytest.mark.asyncio
+async def test_serve_server_port_in_use():
+    """Test that failing to bind raises OSError instead of exiting the event loop."""
+    import peloterm.web.server
+    original_global_web_server = peloterm.web.server.web_server
+    
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()
+        port = sock.getsockname()[1]
+        try:
+            with pytest.raises(OSError):
+                await serve_server(port=port)
+            # Metrics are no longer queued for the server that never started
+            assert peloterm.web.server.web_server is None
+        finally:
+            peloterm.web.server.web_server = original_global_web_server
+
+
+def test_queue_metrics_keeps_latest_value():
+    """Test that pending samples stay bounded when the drain loop isn't running."""
+    server = WebServer(ride_duration_minutes=30, update_interval=0.01)
+    
+    for power in range(1000):
+        server.queue_metrics({"power": power, "cadence": 90})
+    
+    assert server.pending_metrics == {"power": 999, "cadence": 90}
@@ -5,17 +5,30 @@ import asyncio
 import time
 import threading
 from pathlib import Path
-from typing import Dict, Set, List, Any, Optional
+from typing import Dict, Set, List, Any, Optional, Tuple
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 import uvicorn
 from ..data_processor import DataProcessor
 from ..data_recorder import RideRecorder
 from ..strava_integration import StravaUploader
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data: Any) -> str:
+    """Serialize a WebSocket message, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -23,6 +36,7 @@ async def lifespan(app: FastAPI):
     # Startup
     if hasattr(app.state, "web_server"):
         app.state.web_server.update_task = asyncio.create_task(app.state.web_server.update_loop())
+        app.state.web_server.drain_task = asyncio.create_task(app.state.web_server.drain_loop())
     
     yield
     
@@ -31,13 +45,14 @@ async def lifespan(app: FastAPI):
         # Set shutdown event first
         app.state.web_server.shutdown_event.set()
         
-        # Cancel update task
-        if app.state.web_server.update_task:
-            app.state.web_server.update_task.cancel()
-            try:
-                await app.state.web_server.update_task
-            except asyncio.CancelledError:
-                pass
+        # Cancel update and drain tasks
+        for task in (app.state.web_server.update_task, app.state.web_server.drain_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
         
         # Close all WebSocket connections with a close code
         for connection in app.state.web_server.active_connections.copy():
@@ -55,8 +70,27 @@ async def lifespan(app: FastAPI):
         app.state.web_server.control_connections.clear()
 
 
+class _ReadyServer(uvicorn.Server):
+    """Uvicorn server that sets an event once it is accepting connections."""
+    
+    def __init__(self, config: uvicorn.Config, ready_event: Optional[asyncio.Event] = None):
+        super().__init__(config)
+        self.ready_event = ready_event
+    
+    async def startup(self, sockets=None):
+        await super().startup(sockets=sockets)
+        if self.started and self.ready_event is not None:
+            self.ready_event.set()
+
+
 class WebServer:
-    def __init__(self, ride_duration_minutes: int = 30, update_interval: float = 1.0):
+    def __init__(
+        self,
+        ride_duration_minutes: int = 30,
+        update_interval: float = 1.0,
+        compress: bool = True,
+        batch_interval: float = 0.1,
+    ):
         self.app = FastAPI(
             title="Peloterm",
             description="Cycling Metrics Dashboard",
@@ -77,6 +111,10 @@ class WebServer:
             allow_headers=["*"],
         )
         
+        # Compress the static bundle and JSON responses for remote clients
+        if compress:
+            self.app.add_middleware(GZipMiddleware, minimum_size=500)
+        
         self.active_connections: Set[WebSocket] = set()
         self.control_connections: Set[WebSocket] = set()
         self.ride_duration_minutes = ride_duration_minutes
@@ -84,8 +122,20 @@ class WebServer:
         self.data_processor = DataProcessor()
         self.update_interval = update_interval
         self.update_task = None
+        self.drain_task = None
         self.server = None  # Store the uvicorn server instance
         self.shutdown_event = threading.Event()  # Add shutdown event
+        # (loop, event) per open websocket, set by stop() to wake handlers blocked on receive
+        self.closing_waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+        
+        # Latest value per metric queued by device callbacks, applied in batches by
+        # drain_loop. Newer samples overwrite older ones, so it stays bounded even if
+        # the drain loop falls behind.
+        self.pending_metrics: Dict[str, Any] = {}
+        self.pending_lock = threading.Lock()
+        self.metrics_ready = asyncio.Event()
+        self.metrics_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.batch_interval = batch_interval
         
         # Recording functionality
         self.ride_recorder = RideRecorder()
@@ -146,6 +196,8 @@ class WebServer:
             """Handle WebSocket connections for real-time metrics."""
             await websocket.accept()
             self.active_connections.add(websocket)
+            closing = (asyncio.get_running_loop(), asyncio.Event())
+            self.closing_waiters.add(closing)
             
             try:
                 # No historical data sending - clients get real-time data immediately
@@ -154,11 +206,10 @@ class WebServer:
                 # Keep connection alive and handle incoming messages
                 while not self.shutdown_event.is_set():
                     try:
-                        # Short timeout to check shutdown event frequently
-                        data = await asyncio.wait_for(websocket.receive_text(), timeout=0.1)
+                        data = await self._receive_until_closing(websocket, closing[1])
+                        if data is None:
+                            break
                         # Handle any incoming messages here if needed
-                    except asyncio.TimeoutError:
-                        continue
                     except WebSocketDisconnect:
                         break
                     except Exception:
@@ -167,6 +218,7 @@ class WebServer:
                 # Always clean up the connection
                 if websocket in self.active_connections:
                     self.active_connections.remove(websocket)
+                self.closing_waiters.discard(closing)
                 try:
                     await websocket.close(code=1000)  # Normal closure
                 except Exception:
@@ -177,6 +229,8 @@ class WebServer:
             """Handle WebSocket connections for recording control commands."""
             await websocket.accept()
             self.control_connections.add(websocket)
+            closing = (asyncio.get_running_loop(), asyncio.Event())
+            self.closing_waiters.add(closing)
             
             try:
                 print("New control WebSocket client connected")
@@ -192,10 +246,10 @@ class WebServer:
                 # Handle incoming control commands
                 while not self.shutdown_event.is_set():
                     try:
-                        data = await asyncio.wait_for(websocket.receive_text(), timeout=0.1)
+                        data = await self._receive_until_closing(websocket, closing[1])
+                        if data is None:
+                            break
                         await self._handle_control_command(websocket, json.loads(data))
-                    except asyncio.TimeoutError:
-                        continue
                     except WebSocketDisconnect:
                         break
                     except Exception as e:
@@ -208,11 +262,23 @@ class WebServer:
                 # Always clean up the connection
                 if websocket in self.control_connections:
                     self.control_connections.remove(websocket)
+                self.closing_waiters.discard(closing)
                 try:
                     await websocket.close(code=1000)  # Normal closure
                 except Exception:
                     pass
 
+    async def _receive_until_closing(self, websocket: WebSocket, closing_event: asyncio.Event) -> Optional[str]:
+        """Wait for the next text message, or return None once the server is stopping."""
+        receive = asyncio.ensure_future(websocket.receive_text())
+        closing = asyncio.ensure_future(closing_event.wait())
+        done, _ = await asyncio.wait({receive, closing}, return_when=asyncio.FIRST_COMPLETED)
+        if receive in done:
+            closing.cancel()
+            return receive.result()
+        receive.cancel()
+        return None
+
     async def update_loop(self, timeout: Optional[float] = None):
         """Regular update loop to process and broadcast metrics."""
         start_time = time.time()
@@ -234,22 +300,8 @@ class WebServer:
                         "timestamp": current_time
                     }
 
-                    # Broadcast to all connected clients immediately
-                    message = json.dumps(timestamped_metrics)
-                    disconnected = set()
-                    
-                    for connection in self.active_connections.copy():
-                        try:
-                            await connection.send_text(message)
-                        except Exception:
-                            disconnected.add(connection)
-                            try:
-                                await connection.close(code=1000)
-                            except Exception:
-                                pass
-                    
-                    # Remove disconnected clients
-                    self.active_connections -= disconnected
+                    # Broadcast one coalesced message to all connected clients
+                    await self._broadcast_text(self.active_connections, _dumps(timestamped_metrics))
 
             except Exception as e:
                 print(f"Error in update loop: {e}")
@@ -259,11 +311,54 @@ class WebServer:
             except asyncio.CancelledError:
                 break
 
+    async def drain_loop(self):
+        """Apply queued metric samples in batches, at most once per batch interval."""
+        self.metrics_loop = asyncio.get_running_loop()
+        while not self.shutdown_event.is_set():
+            await self.metrics_ready.wait()
+            # Let samples from the other sensors accumulate for one tick so a burst
+            # of notifications becomes a single update and recorder data point
+            if self.batch_interval > 0:
+                await asyncio.sleep(self.batch_interval)
+            self.metrics_ready.clear()
+            
+            # Take everything queued since the last wakeup
+            with self.pending_lock:
+                merged, self.pending_metrics = self.pending_metrics, {}
+            
+            if merged:
+                self.update_metrics(merged)
+
+    def queue_metrics(self, metrics: Dict[str, Any]):
+        """Queue metric samples to be applied by the drain loop.
+        
+        Safe to call from device callbacks on other threads.
+        """
+        with self.pending_lock:
+            self.pending_metrics.update(metrics)
+        if self.metrics_ready.is_set():
+            # The drain loop is already due to run and will pick these up
+            return
+        
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        
+        if self.metrics_loop is None or running_loop is self.metrics_loop:
+            self.metrics_ready.set()
+        elif not self.metrics_loop.is_closed():
+            self.metrics_loop.call_soon_threadsafe(self.metrics_ready.set)
+
     def update_metric(self, metric_name: str, value: Any):
         """Update a metric in the data processor."""
-        self.data_processor.update_metric(metric_name, value)
+        self.update_metrics({metric_name: value})
+
+    def update_metrics(self, metrics: Dict[str, Any]):
+        """Update several metrics in the data processor at once."""
+        self.data_processor.update_metrics(metrics)
         
-        # If recording (and not paused), add data point to recorder
+        # If recording (and not paused), add one data point for the whole batch
         if self.is_recording and not self.is_paused:
             current_metrics = self.data_processor.get_processed_metrics()
             if current_metrics:
@@ -272,7 +367,7 @@ class WebServer:
     async def _send_control_message(self, websocket: WebSocket, message: Dict[str, Any]):
         """Send a control message to a specific WebSocket connection."""
         try:
-            await websocket.send_text(json.dumps(message))
+            await websocket.send_text(_dumps(message))
         except Exception as e:
             print(f"Error sending control message: {e}")
     
@@ -281,21 +376,28 @@ class WebServer:
         if not self.control_connections:
             return
             
-        message_text = json.dumps(message)
-        disconnected = set()
+        await self._broadcast_text(self.control_connections, _dumps(message))
+    
+    async def _broadcast_text(self, connections: Set[WebSocket], message: str):
+        """Send a message to all connections at once, dropping any that fail.
         
-        for connection in self.control_connections.copy():
-            try:
-                await connection.send_text(message_text)
-            except Exception:
-                disconnected.add(connection)
+        Args:
+            connections: The connection set to send to; failed clients are removed from it
+            message: The serialized message
+        """
+        targets = list(connections)
+        results = await asyncio.gather(
+            *(connection.send_text(message) for connection in targets),
+            return_exceptions=True
+        )
+        
+        for connection, result in zip(targets, results):
+            if isinstance(result, Exception):
+                connections.discard(connection)
                 try:
                     await connection.close(code=1000)
                 except Exception:
                     pass
-        
-        # Remove disconnected clients
-        self.control_connections -= disconnected
     
     async def _handle_control_command(self, websocket: WebSocket, data: Dict[str, Any]):
         """Handle incoming control commands."""
@@ -471,8 +573,20 @@ class WebServer:
         await self._broadcast_control_message(message)
         print("🗑️ Recording cleared via web UI")
 
-    def start(self, host: str = "127.0.0.1", port: int = 8000):
-        """Start the web server."""
+    def _create_uvicorn_server(
+        self,
+        host: str,
+        port: int,
+        loop: str = "auto",
+        http: str = "auto",
+        ready_event: Optional[asyncio.Event] = None
+    ) -> uvicorn.Server:
+        """Create the uvicorn server instance for this app.
+        
+        With "auto", uvicorn picks uvloop and httptools when they are installed
+        and falls back to asyncio and h11 otherwise. ready_event, if given, is
+        set once the server is accepting connections.
+        """
         import logging
         # Reduce uvicorn logging verbosity
         logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
@@ -483,24 +597,52 @@ class WebServer:
             host=host, 
             port=port, 
             log_level="warning",
-            access_log=False
+            access_log=False,
+            loop=loop,
+            http=http
         )
-        self.server = uvicorn.Server(config)
+        return _ReadyServer(config, ready_event)
+
+    def start(self, host: str = "127.0.0.1", port: int = 8000, loop: str = "auto", http: str = "auto"):
+        """Start the web server."""
+        self.server = self._create_uvicorn_server(host, port, loop=loop, http=http)
         self.server.run()
+
+    async def serve(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        http: str = "auto",
+        ready_event: Optional[asyncio.Event] = None
+    ):
+        """Serve the web server on the running event loop.
+        
+        Raises:
+            OSError: If the server fails to start, e.g. the port is in use
+        """
+        self.server = self._create_uvicorn_server(host, port, http=http, ready_event=ready_event)
+        try:
+            await self.server.serve()
+        except SystemExit as e:
+            # uvicorn calls sys.exit() when startup fails; don't let that end
+            # the caller's event loop, and stop the tasks the lifespan started
+            await self.shutdown()
+            raise OSError(f"Web server failed to start on {host}:{port}") from e
     
     async def shutdown(self):
         """Gracefully shut down the web server. (Primarily for internal/lifespan use)"""
         self.shutdown_event.set() # Signal all loops and operations to stop
         
-        # Attempt to cancel the update_task if it's running
-        if self.update_task and not self.update_task.done():
-            self.update_task.cancel()
-            try:
-                await self.update_task
-            except asyncio.CancelledError:
-                pass # Expected
-            except Exception as e:
-                print(f"Error cancelling update_task during shutdown: {e}")
+        # Attempt to cancel the update and drain tasks if they're running
+        for task in (self.update_task, self.drain_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass # Expected
+                except Exception as e:
+                    print(f"Error cancelling task during shutdown: {e}")
 
         # Close all WebSocket connections
         # This is also done in lifespan, but good to have here for direct shutdown calls
@@ -530,6 +672,10 @@ class WebServer:
         """
         print("WebServer.stop() called, signaling shutdown.")
         self.shutdown_event.set() # Signal tasks like update_loop and websocket handlers
+        # Wake websocket handlers blocked on receive; stop() may run on another thread
+        for loop, event in self.closing_waiters.copy():
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(event.set)
         if self.server:
             print("Signaling uvicorn server to exit.")
             self.server.should_exit = True # Signal uvicorn server instance to stop
@@ -544,11 +690,43 @@ class WebServer:
 web_server = None
 
 
-def start_server(host: str = "127.0.0.1", port: int = 8000, ride_duration_minutes: int = 30):
+def start_server(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    ride_duration_minutes: int = 30,
+    loop: str = "auto",
+    http: str = "auto",
+    compress: bool = True
+):
     """Start the web server."""
     global web_server
-    web_server = WebServer(ride_duration_minutes=ride_duration_minutes)
-    web_server.start(host, port)
+    web_server = WebServer(ride_duration_minutes=ride_duration_minutes, compress=compress)
+    web_server.start(host, port, loop=loop, http=http)
+
+
+async def serve_server(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    ride_duration_minutes: int = 30,
+    http: str = "auto",
+    compress: bool = True,
+    ready_event: Optional[asyncio.Event] = None
+):
+    """Serve the web server on the running event loop.
+
+    Unlike start_server, this does not block a thread, so device callbacks and
+    the metric update loop can share the caller's event loop. ready_event, if
+    given, is set once the server is accepting connections. Raises OSError if
+    the server fails to start.
+    """
+    global web_server
+    web_server = WebServer(ride_duration_minutes=ride_duration_minutes, compress=compress)
+    try:
+        await web_server.serve(host, port, http=http, ready_event=ready_event)
+    except OSError:
+        # Nothing is serving, so stop queueing metrics for it
+        web_server = None
+        raise
 
 
 def stop_server():
@@ -564,14 +742,31 @@ def broadcast_metrics(metrics: Dict):
     """Update metrics in the data processor."""
     if web_server:
         # Update the data processor
-        for metric_name, value in metrics.items():
-            web_server.update_metric(metric_name, value)
+        web_server.update_metrics(metrics)
     else:
         print("❌ No web_server instance found for broadcast_metrics")
 
 
+def queue_metrics(metrics: Dict):
+    """Queue metrics for batched processing on the web server's event loop."""
+    if web_server:
+        web_server.queue_metrics(metrics)
+
+
 def start_server_with_mock_data(host: str = "127.0.0.1", port: int = 8000, ride_duration_minutes: int = 30):
     """Start the web server with integrated mock data generation for development."""
+    create_mock_web_server(ride_duration_minutes).start(host, port)
+
+
+def create_mock_web_server(ride_duration_minutes: int = 30) -> WebServer:
+    """Create the global web server wired to a mock device for development.
+    
+    Args:
+        ride_duration_minutes: Planned ride duration shown in the UI
+    
+    Returns:
+        The configured WebServer; serve it with start() or serve()
+    """
     global web_server
     web_server = WebServer(ride_duration_minutes=ride_duration_minutes)
     
@@ -643,9 +838,7 @@ def start_server_with_mock_data(host: str = "127.0.0.1", port: int = 8000, ride_
                     pass
     
     web_server.app.router.lifespan_context = enhanced_lifespan
-    
-    # Start the server
-    web_server.start(host, port)
+    return web_server
 
 
 if __name__ == "__main__":
@@ -4,57 +4,88 @@ Development script for Peloterm.
 Provides easy access to development and production modes.
 """
 
-import subprocess
+import asyncio
+import os
+import signal
 import sys
-import time
 import argparse
 from pathlib import Path
 
-def run_vue_dev():
+async def run_vue_dev():
     """Run the Vue development server."""
     frontend_dir = Path(__file__).parent.parent / "frontend"
-    return subprocess.Popen(
-        ["npm", "run", "dev"],
+    return await asyncio.create_subprocess_exec(
+        "npm", "run", "dev",
         cwd=frontend_dir
     )
 
-def run_fastapi_dev():
-    """Run the FastAPI development server."""
-    return subprocess.Popen(
-        [sys.executable, "-m", "peloterm.web.server"],
-        cwd=Path(__file__).parent.parent
-    )
+async def stop_process(process):
+    """Terminate a child process, killing it if it doesn't exit in time."""
+    if process.returncode is not None:
+        return
+    process.terminate()
+    try:
+        await asyncio.wait_for(process.wait(), timeout=5)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+
+async def supervise_dev_servers():
+    """Run the Vue dev server and the mock-data FastAPI server until either exits."""
+    # The API server runs on this loop so its module globals stay in this process
+    from peloterm.web.server import create_mock_web_server
+    
+    print("Starting Vue dev server on http://localhost:5173...")
+    vue_process = await run_vue_dev()
+    web_server = create_mock_web_server(ride_duration_minutes=30)
+    server_ready = asyncio.Event()
+    server_task = asyncio.create_task(web_server.serve(port=8000, ready_event=server_ready))
+    ready_task = asyncio.create_task(server_ready.wait())
+    vue_wait = asyncio.create_task(vue_process.wait())
+    
+    try:
+        # Announce the servers once the API is accepting connections, rather
+        # than after a fixed delay; Vite prints its own URL when it is ready
+        await asyncio.wait({ready_task, server_task, vue_wait}, return_when=asyncio.FIRST_COMPLETED)
+        if server_ready.is_set():
+            print("\n✅ Development servers started!")
+            print("📱 Vue UI: http://localhost:5173 (or check console for actual port)")
+            print("🔌 FastAPI: http://localhost:8000")
+            print("📊 API Config: http://localhost:8000/api/config")
+            print("🚴 Mock devices enabled for development")
+            print("\nPress Ctrl+C to stop both servers")
+        
+        # Sleep until either server exits instead of polling them
+        done, _ = await asyncio.wait({server_task, vue_wait}, return_when=asyncio.FIRST_COMPLETED)
+        if vue_wait in done:
+            # Ctrl+C reaches the whole process group, so Vite may exit first
+            if vue_process.returncode in (-signal.SIGINT, 128 + signal.SIGINT):
+                raise KeyboardInterrupt
+            print("❌ Vue dev server stopped unexpectedly")
+        elif not server_task.cancelled() and server_task.exception():
+            print(f"❌ FastAPI server stopped: {server_task.exception()}")
+    finally:
+        ready_task.cancel()
+        vue_wait.cancel()
+        if not server_task.done():
+            if web_server.server:
+                web_server.server.should_exit = True
+            try:
+                await asyncio.wait_for(server_task, timeout=5)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                pass
+        await stop_process(vue_process)
 
 def dev_mode():
     """Run both Vue dev server and FastAPI for development."""
     print("🚴 Starting Peloterm Development Environment")
     print("=" * 50)
     
-    vue_process = None
-    
     try:
-        # Start Vue dev server
-        print("Starting Vue dev server on http://localhost:5173...")
-        vue_process = run_vue_dev()
-        time.sleep(3)
-        
-        print("\n✅ Development servers starting!")
-        print("📱 Vue UI: http://localhost:5173 (or check console for actual port)")
-        print("🔌 FastAPI: http://localhost:8000")
-        print("📊 API Config: http://localhost:8000/api/config")
-        print("🚴 Mock devices enabled for development")
-        print("\nPress Ctrl+C to stop both servers")
-        
-        # Start FastAPI server with integrated mock data generation
-        # This runs in the main thread so globals work properly
-        from peloterm.web.server import start_server_with_mock_data
-        start_server_with_mock_data(port=8000, ride_duration_minutes=30)
-                
+        asyncio.run(supervise_dev_servers())
     except KeyboardInterrupt:
         print("\n🛑 Stopping development servers...")
     finally:
-        if vue_process:
-            vue_process.terminate()
         print("✅ Development servers stopped")
 
 def prod_mode():
@@ -65,14 +96,13 @@ def prod_mode():
     # Check if built files exist
     static_dir = Path(__file__).parent.parent / "peloterm" / "web" / "static"
     if not (static_dir / "index.html").exists():
-        print("❌ No built frontend found. Run 'python build.py' first.")
+        print("❌ No built frontend found. Run 'python scripts/build.py' first.")
         sys.exit(1)
     
     print("🚀 Starting production server on http://localhost:8000...")
-    try:
-        subprocess.run([sys.executable, "-m", "peloterm.web.server"])
-    except KeyboardInterrupt:
-        print("\n✅ Production server stopped")
+    # Replace this process with the server so signals reach it directly
+    os.chdir(Path(__file__).parent.parent)
+    os.execvp(sys.executable, [sys.executable, "-m", "peloterm.web.server"])
 
 def main():
     parser = argparse.ArgumentParser(description="Peloterm Development Script")